@@ -1,10 +1,20 @@
 """AuditHound - Security audit compliance scanning tool."""
 
+from typing import Any
+
 __version__ = "0.1.0"
 __author__ = "AuditHound Team"
 __description__ = "A robust TUI application for security audit compliance scanning"
 
-from .core.config import Config
-from .core.scanner import SecurityScanner
+__all__ = ["Config", "SecurityScanner", "__version__"]
+
 
-__all__ = ["Config", "SecurityScanner", "__version__"]
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # Deferred so CLI commands only load what they use
+    if name == "Config":
+        from .core.config import Config
+        return Config
+    if name == "SecurityScanner":
+        from .core.scanner import SecurityScanner
+        return SecurityScanner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1 @@
+"""Command implementations loaded on demand by the CLI."""
@@ -0,0 +1,174 @@
+"""Sample project written by the ``audithound example`` command."""
+
+from pathlib import Path
+
+from ..core.config import Config
+
+# Sample vulnerable Python code
+_EXAMPLE_VULNERABLE_APP = b'''
+import os
+import pickle
+import sqlite3
+from flask import Flask, request
+
+app = Flask(__name__)
+
+# Hardcoded credentials (bandit will catch this)
+API_KEY = "sk-1234567890abcdef"
+DATABASE_PASSWORD = "admin123"
+
+# SQL Injection vulnerability
+def get_user(user_id):
+    conn = sqlite3.connect("users.db")
+    cursor = conn.cursor()
+    # Vulnerable to SQL injection
+    query = f"SELECT * FROM users WHERE id = {user_id}"
+    cursor.execute(query)
+    return cursor.fetchone()
+
+# Command injection vulnerability
+@app.route('/ping')
+def ping():
+    host = request.args.get('host', 'localhost')
+    # Vulnerable to command injection
+    result = os.system(f'ping -c 1 {host}')
+    return f"Ping result: {result}"
+
+# Pickle deserialization vulnerability
+def load_config(config_data):
+    # Dangerous use of pickle
+    return pickle.loads(config_data)
+
+# Weak random generation
+def generate_token():
+    import random
+    return random.randint(1000, 9999)
+
+if __name__ == "__main__":
+    app.run(debug=True, host='0.0.0.0')  # Debug mode in production
+'''
+
+# Sample Dockerfile with security issues
+_EXAMPLE_DOCKERFILE = b'''
+FROM ubuntu:latest
+
+# Running as root (security issue)
+USER root
+
+# Installing packages without specific versions
+RUN apt-get update && apt-get install -y \\
+    python3 \\
+    python3-pip \\
+    curl \\
+    wget
+
+# Copying secrets into image (bad practice)
+COPY secret_key.txt /app/
+
+# Setting weak permissions
+RUN chmod 777 /app
+
+# Exposing unnecessary ports
+EXPOSE 22 80 443 8080 9000
+
+# Running with elevated privileges
+CMD ["python3", "app.py"]
+'''
+
+# Sample requirements.txt with vulnerable packages
+_EXAMPLE_REQUIREMENTS = b'''
+Django==2.0.0
+requests==2.20.0
+Pillow==5.0.0
+PyYAML==3.13
+Jinja2==2.10
+'''
+
+# Sample Kubernetes manifest with security issues
+_EXAMPLE_K8S_MANIFEST = b'''
+apiVersion: v1
+kind: Pod
+metadata:
+  name: vulnerable-pod
+spec:
+  containers:
+  - name: app
+    image: nginx:latest
+    securityContext:
+      privileged: true
+      runAsUser: 0
+    env:
+    - name: API_KEY
+      value: "hardcoded-secret-key"
+    ports:
+    - containerPort: 80
+    volumeMounts:
+    - name: host-root
+      mountPath: /host
+  volumes:
+  - name: host-root
+    hostPath:
+      path: /
+'''
+
+# README for the example directory; {output_dir} is filled in per call
+_EXAMPLE_README = '''# AuditHound Example
+
+This directory contains example vulnerable code for testing AuditHound scanners.
+
+## Files included:
+- `audithound.yaml` - Example configuration
+- `vulnerable_app.py` - Python code with security vulnerabilities
+- `Dockerfile` - Docker configuration with security issues
+- `requirements.txt` - Python dependencies with known vulnerabilities
+- `k8s-pod.yaml` - Kubernetes manifest with security misconfigurations
+- `secret_key.txt` - Hardcoded secret file
+
+## How to scan:
+```bash
+# Interactive mode
+audithound scan {output_dir}
+
+# Headless mode with JSON output
+audithound scan {output_dir} --no-interactive --output results.json
+
+# Scan with specific tools only
+audithound scan {output_dir} --tools bandit,safety --no-interactive
+```
+
+## Expected findings:
+- **Bandit**: Hardcoded credentials, SQL injection, command injection, pickle usage
+- **Safety**: Vulnerable Python packages in requirements.txt
+- **Semgrep**: Code quality and security patterns
+- **TruffleHog**: Hardcoded secrets in files
+- **Checkov**: Dockerfile and Kubernetes security misconfigurations
+
+⚠️  **Warning**: This code is intentionally vulnerable and should not be used in production!
+'''
+
+# Example files written verbatim by the example command
+_EXAMPLE_FILES = {
+    "vulnerable_app.py": _EXAMPLE_VULNERABLE_APP,
+    "Dockerfile": _EXAMPLE_DOCKERFILE,
+    "requirements.txt": _EXAMPLE_REQUIREMENTS,
+    "k8s-pod.yaml": _EXAMPLE_K8S_MANIFEST,
+    "secret_key.txt": b"super-secret-api-key-12345",
+}
+
+
+def write_example(output_path: Path, output_dir: str) -> None:
+    """Create the example config, vulnerable sample files and README in output_path."""
+    output_path.mkdir(exist_ok=True)
+    
+    # The scaffold is disposable, so the config is written alongside the other
+    # files rather than through Config.save()'s temp file, fsync and rename
+    files = {"audithound.yaml": Config.default().to_yaml().encode('utf-8'), **_EXAMPLE_FILES}
+    
+    # Write example files
+    for name, data in files.items():
+        (output_path / name).write_bytes(data)
+    
+    # Create README
+    (output_path / "README.md").write_bytes(
+        _EXAMPLE_README.format(output_dir=output_dir).encode('utf-8')
+    )
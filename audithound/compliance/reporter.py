@@ -1,16 +1,157 @@
 """Compliance reporting and audit documentation generator."""
 
 import json
-import yaml
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from string import Template
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
 
 from .frameworks import ComplianceFramework, Severity
 
 
-@dataclass 
+_STATUS_EMOJI = {
+    "compliant": "✅",
+    "non_compliant": "❌",
+    "needs_review": "⚠️"
+}
+
+# Maximum number of evidence files recorded per control
+_MAX_EVIDENCE_FILES = 10
+
+# Recommendations included in every report
+_GENERIC_RECOMMENDATIONS = (
+    "Implement automated security scanning in CI/CD pipelines to prevent regression.",
+    "Establish regular security audit cycles (quarterly recommended).",
+    "Provide security training to development teams on secure coding practices.",
+    "Document all remediation efforts for audit trail purposes.",
+    "Consider engaging security consultants for complex compliance requirements."
+)
+
+# Remediation guidance by control category
+_CATEGORY_GUIDANCE: Mapping[str, str] = MappingProxyType({
+    "Security": "Review access controls, encryption, and authentication mechanisms.",
+    "Identify": "Update asset inventory and risk assessment procedures.",
+    "Protect": "Strengthen protective controls and data handling procedures.",
+    "Detect": "Enhance monitoring and detection capabilities.",
+    "Respond": "Review incident response procedures and forensic capabilities.",
+    "Basic": "Address fundamental security controls as highest priority.",
+    "Foundational": "Strengthen core security infrastructure.",
+    "Organizational": "Review governance and policy frameworks."
+})
+
+
+# Severity presence bits used to index the status tables below
+_HAS_CRITICAL = 0b1000
+_HAS_HIGH = 0b0100
+_HAS_MEDIUM = 0b0010
+_HAS_LOW = 0b0001
+
+# Severity members bound once at module level
+_SEV_CRITICAL = Severity.CRITICAL
+_SEV_HIGH = Severity.HIGH
+_SEV_MEDIUM = Severity.MEDIUM
+_SEV_LOW = Severity.LOW
+_SEV_INFO = Severity.INFO
+
+# Per threshold: (bits that make a control non-compliant, bits that need review)
+_STATUS_RULES = {
+    _SEV_CRITICAL: (_HAS_CRITICAL, 0),
+    _SEV_HIGH: (_HAS_CRITICAL | _HAS_HIGH, 0),
+    _SEV_MEDIUM: (_HAS_CRITICAL, _HAS_HIGH | _HAS_MEDIUM),
+    _SEV_LOW: (_HAS_CRITICAL, _HAS_HIGH | _HAS_MEDIUM | _HAS_LOW),
+    _SEV_INFO: (_HAS_CRITICAL, 0),
+}
+
+# Compliance status for every threshold and severity presence mask
+_STATUS_BY_THRESHOLD = {
+    threshold: tuple(
+        "non_compliant" if mask & non_compliant_bits
+        else "needs_review" if mask & review_bits
+        else "compliant"
+        for mask in range(16)
+    )
+    for threshold, (non_compliant_bits, review_bits) in _STATUS_RULES.items()
+}
+
+# Markdown report fragments, parsed once at import
+_MD_HEADER = Template("""# Security Audit Report
+## ${framework} Compliance Assessment
+
+**Organization:** ${organization}  
+**Audit Date:** ${scan_date}  
+**Auditor:** ${auditor}  
+**Target System:** ${scan_target}
+
+---
+
+${executive_summary}
+
+## Detailed Compliance Results
+
+**Framework:** ${framework} v${framework_version}  
+**Total Applicable Controls:** ${total_controls}  
+**Compliance Rate:** ${compliance_percentage}%
+
+| Status | Count | Percentage |
+|--------|-------|------------|
+| ✅ Compliant | ${compliant_controls} | ${compliant_pct}% |
+| ❌ Non-Compliant | ${non_compliant_controls} | ${non_compliant_pct}% |
+| ⚠️ Needs Review | ${needs_review_controls} | ${needs_review_pct}% |
+
+## Control-by-Control Analysis
+
+""")
+
+_MD_CONTROL = Template("""### ${status_emoji} Control ${control_id}
+
+**Scanner(s):** ${scanner}  
+**Total Findings:** ${finding_count}  
+**Status:** ${status}
+
+**Finding Breakdown:**
+- Critical: ${critical_count}
+- High: ${high_count}  
+- Medium: ${medium_count}
+- Low: ${low_count}
+
+**Remediation Notes:**
+${remediation_notes}
+
+**Evidence Files:** ${evidence_file_count} file(s) analyzed
+
+---
+
+""")
+
+_MD_RECOMMENDATIONS_HEADER = """## Recommendations
+
+"""
+
+_MD_ATTESTATION = Template("""
+
+## Auditor Attestation
+
+${auditor_statement}
+
+**Methodology:** ${methodology}  
+**Scope:** ${scope}  
+**Limitations:** ${limitations}
+
+**Auditor:** ${auditor} (${auditor_title})  
+**Organization:** ${audit_firm}  
+**Date:** ${date}
+
+---
+
+*This report was generated by AuditHound - Automated Security Audit Platform*
+""")
+
+
+@dataclass(slots=True)
 class ComplianceEvidence:
     """Evidence for compliance control."""
     control_id: str
@@ -25,7 +166,7 @@ class ComplianceEvidence:
     remediation_notes: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditReport:
     """Complete audit report structure."""
     framework: str
@@ -45,6 +186,52 @@ class AuditReport:
     attestation: Dict[str, Any]
 
 
+def _shallow_fields(obj: Any) -> Dict[str, Any]:
+    """Map a dataclass instance to its fields without deep-copying nested values."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+class _ReportEncoder(json.JSONEncoder):
+    """JSON encoder that serializes report dataclasses as they are walked."""
+    
+    def default(self, o: Any) -> Any:
+        if is_dataclass(o) and not isinstance(o, type):
+            return _shallow_fields(o)
+        return str(o)
+
+
+@lru_cache(maxsize=None)
+def _report_dumper() -> type:
+    """Build the YAML dumper for reports, importing PyYAML on first use."""
+    import yaml
+    
+    try:
+        base = yaml.CSafeDumper
+    except AttributeError:  # PyYAML built without libyaml
+        base = yaml.SafeDumper
+    
+    class _ReportDumper(base):
+        """YAML dumper that represents report dataclasses as mappings."""
+    
+    for report_type in (AuditReport, ComplianceEvidence):
+        _ReportDumper.add_representer(
+            report_type,
+            lambda dumper, data: dumper.represent_dict(_shallow_fields(data))
+        )
+    
+    return _ReportDumper
+
+
+@dataclass(frozen=True, slots=True)
+class _ScannerStats:
+    """Severity counts and evidence files aggregated for one scanner."""
+    critical: int
+    high: int
+    medium: int
+    low: int
+    files: Tuple[str, ...]
+
+
 class ComplianceReporter:
     """Generate compliance reports for security audits."""
     
@@ -69,11 +256,17 @@ class ComplianceReporter:
         non_compliant = 0
         needs_review = 0
         
-        applicable_controls = self.framework.get_applicable_controls(scan_results)
-        
-        for control_id in applicable_controls:
-            control = self.framework.controls[control_id]
-            evidence = self._analyze_control_compliance(control, scan_results)
+        # Aggregate each scanner's findings once; controls share scanners
+        scanner_stats = {}
+        for scanner_name, scanner_result in scan_results.get('results_by_scanner', {}).items():
+            findings = getattr(scanner_result, 'findings', None)
+            if findings:
+                scanner_stats[scanner_name] = self._aggregate_findings(findings)
+        
+        total_controls = 0
+        for _, control in self.framework.iter_applicable_controls(scan_results):
+            total_controls += 1
+            evidence = self._analyze_control_compliance(control, scanner_stats)
             evidence_list.append(evidence)
             
             # Count compliance status
@@ -84,7 +277,6 @@ class ComplianceReporter:
             else:
                 needs_review += 1
         
-        total_controls = len(applicable_controls)
         compliance_percentage = (compliant / total_controls * 100) if total_controls > 0 else 0
         
         # Generate executive summary
@@ -125,46 +317,61 @@ class ComplianceReporter:
             attestation=attestation
         )
     
+    def _aggregate_findings(self, findings: List[Dict[str, Any]]) -> _ScannerStats:
+        """Count findings by severity and collect evidence files for one scanner."""
+        
+        severity_counts = Counter()
+        files_seen = {}  # insertion-ordered set of evidence files
+        
+        for finding in findings:
+            severity_counts[finding.get('severity', 'low').lower()] += 1
+            
+            # Only the first few distinct files are kept as evidence
+            file_path = finding.get('file')
+            if file_path and len(files_seen) < _MAX_EVIDENCE_FILES:
+                files_seen.setdefault(file_path, None)
+        
+        critical = severity_counts['critical']
+        high = severity_counts['high']
+        medium = severity_counts['medium']
+        # Anything not critical/high/medium is reported as low
+        low = len(findings) - critical - high - medium
+        
+        return _ScannerStats(critical, high, medium, low, tuple(files_seen))
+    
     def _analyze_control_compliance(
         self, 
         control: 'ComplianceControl', 
-        scan_results: Dict[str, Any]
+        scanner_stats: Dict[str, _ScannerStats]
     ) -> ComplianceEvidence:
         """Analyze compliance status for a specific control."""
         
-        # Count findings by severity for relevant scanners
-        total_findings = 0
+        # Sum precomputed severity counts for relevant scanners
         critical_count = 0
         high_count = 0
         medium_count = 0
         low_count = 0
-        evidence_files = []
-        
-        results_by_scanner = scan_results.get('results_by_scanner', {})
-        
-        for scanner_name in control.required_scanners:
-            if scanner_name in results_by_scanner:
-                scanner_result = results_by_scanner[scanner_name]
-                if hasattr(scanner_result, 'findings'):
-                    findings = scanner_result.findings
-                    
-                    for finding in findings:
-                        severity = finding.get('severity', 'low').lower()
-                        total_findings += 1
-                        
-                        if severity == 'critical':
-                            critical_count += 1
-                        elif severity == 'high':
-                            high_count += 1
-                        elif severity == 'medium':
-                            medium_count += 1
-                        else:
-                            low_count += 1
-                        
-                        # Collect evidence files
-                        file_path = finding.get('file')
-                        if file_path and file_path not in evidence_files:
-                            evidence_files.append(file_path)
+        files_seen = {}  # insertion-ordered set of evidence files
+        
+        # Sorted so evidence ordering does not depend on set iteration order
+        required_scanners = sorted(control.required_scanners)
+        
+        for scanner_name in required_scanners:
+            stats = scanner_stats.get(scanner_name)
+            if stats is None:
+                continue
+            
+            critical_count += stats.critical
+            high_count += stats.high
+            medium_count += stats.medium
+            low_count += stats.low
+            for file_path in stats.files:
+                if len(files_seen) >= _MAX_EVIDENCE_FILES:
+                    break
+                files_seen.setdefault(file_path, None)
+        
+        total_findings = critical_count + high_count + medium_count + low_count
+        evidence_files = list(files_seen)
         
         # Determine compliance status based on severity threshold
         status = self._determine_compliance_status(
@@ -180,14 +387,14 @@ class ComplianceReporter:
         
         return ComplianceEvidence(
             control_id=control.control_id,
-            scanner=", ".join(control.required_scanners),
+            scanner=", ".join(required_scanners),
             finding_count=total_findings,
             critical_count=critical_count,
             high_count=high_count,
             medium_count=medium_count,
             low_count=low_count,
             status=status,
-            evidence_files=evidence_files[:10],  # Limit to first 10 files
+            evidence_files=evidence_files,
             remediation_notes=remediation
         )
     
@@ -201,19 +408,8 @@ class ComplianceReporter:
     ) -> str:
         """Determine compliance status based on findings and threshold."""
         
-        if critical > 0:
-            return "non_compliant"
-        
-        if threshold == Severity.HIGH and high > 0:
-            return "non_compliant" 
-        
-        if threshold == Severity.MEDIUM and (high > 0 or medium > 0):
-            return "needs_review"
-        
-        if threshold == Severity.LOW and (high > 0 or medium > 0 or low > 0):
-            return "needs_review"
-        
-        return "compliant"
+        mask = (critical > 0) << 3 | (high > 0) << 2 | (medium > 0) << 1 | (low > 0)
+        return _STATUS_BY_THRESHOLD[threshold][mask]
     
     def _generate_executive_summary(
         self,
@@ -256,10 +452,17 @@ RISK ASSESSMENT:
         
         recommendations = []
         
-        # Count issues by type
-        critical_controls = len([e for e in evidence_list if e.critical_count > 0])
-        high_controls = len([e for e in evidence_list if e.high_count > 0])
-        non_compliant = len([e for e in evidence_list if e.status == "non_compliant"])
+        # Count issues by type in a single pass
+        critical_controls = 0
+        high_controls = 0
+        non_compliant = 0
+        for evidence in evidence_list:
+            if evidence.critical_count > 0:
+                critical_controls += 1
+            if evidence.high_count > 0:
+                high_controls += 1
+            if evidence.status == "non_compliant":
+                non_compliant += 1
         
         if critical_controls > 0:
             recommendations.append(
@@ -278,14 +481,7 @@ RISK ASSESSMENT:
                 "Develop remediation plans with defined timelines and responsible parties."
             )
         
-        # Generic recommendations
-        recommendations.extend([
-            "Implement automated security scanning in CI/CD pipelines to prevent regression.",
-            "Establish regular security audit cycles (quarterly recommended).",
-            "Provide security training to development teams on secure coding practices.",
-            "Document all remediation efforts for audit trail purposes.",
-            "Consider engaging security consultants for complex compliance requirements."
-        ])
+        recommendations.extend(_GENERIC_RECOMMENDATIONS)
         
         return recommendations
     
@@ -308,18 +504,7 @@ RISK ASSESSMENT:
             notes += "REVIEW RECOMMENDED: "
         
         # Add control-specific guidance
-        category_guidance = {
-            "Security": "Review access controls, encryption, and authentication mechanisms.",
-            "Identify": "Update asset inventory and risk assessment procedures.",
-            "Protect": "Strengthen protective controls and data handling procedures.", 
-            "Detect": "Enhance monitoring and detection capabilities.",
-            "Respond": "Review incident response procedures and forensic capabilities.",
-            "Basic": "Address fundamental security controls as highest priority.",
-            "Foundational": "Strengthen core security infrastructure.",
-            "Organizational": "Review governance and policy frameworks."
-        }
-        
-        notes += category_guidance.get(control.category, "Review security controls and implement necessary improvements.")
+        notes += _CATEGORY_GUIDANCE.get(control.category, "Review security controls and implement necessary improvements.")
         
         return notes
     
@@ -333,103 +518,67 @@ RISK ASSESSMENT:
         
         output_path = Path(output_path)
         
-        if format.lower() == "json":
-            with open(output_path, 'w') as f:
-                json.dump(asdict(report), f, indent=2, default=str)
+        fmt = format.lower()
+        
+        if fmt == "json":
+            output_path.write_text(
+                json.dumps(report, indent=2, cls=_ReportEncoder), encoding="utf-8"
+            )
         
-        elif format.lower() == "yaml":
+        elif fmt == "yaml":
+            import yaml
+            
             with open(output_path, 'w') as f:
-                yaml.dump(asdict(report), f, default_flow_style=False, sort_keys=False)
+                yaml.dump(report, f, Dumper=_report_dumper(), default_flow_style=False, sort_keys=False)
         
-        elif format.lower() == "markdown":
-            self._export_markdown_report(report, output_path)
+        elif fmt == "markdown":
+            output_path.write_text(self._render_markdown_report(report), encoding="utf-8")
         
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
-    def _export_markdown_report(self, report: AuditReport, output_path: Path) -> None:
-        """Export audit report as professional markdown document."""
-        
-        markdown_content = f"""# Security Audit Report
-## {report.framework} Compliance Assessment
-
-**Organization:** {report.organization}  
-**Audit Date:** {report.scan_date}  
-**Auditor:** {report.auditor}  
-**Target System:** {report.scan_target}
-
----
-
-{report.executive_summary}
-
-## Detailed Compliance Results
-
-**Framework:** {report.framework} v{report.framework_version}  
-**Total Applicable Controls:** {report.total_controls}  
-**Compliance Rate:** {report.compliance_percentage:.1f}%
-
-| Status | Count | Percentage |
-|--------|-------|------------|
-| ✅ Compliant | {report.compliant_controls} | {report.compliant_controls/report.total_controls*100:.1f}% |
-| ❌ Non-Compliant | {report.non_compliant_controls} | {report.non_compliant_controls/report.total_controls*100:.1f}% |
-| ⚠️ Needs Review | {report.needs_review_controls} | {report.needs_review_controls/report.total_controls*100:.1f}% |
-
-## Control-by-Control Analysis
-
-"""
+    def _render_markdown_report(self, report: AuditReport) -> str:
+        """Render audit report as professional markdown document."""
+        
+        total = report.total_controls
+        
+        parts = [_MD_HEADER.substitute(
+            framework=report.framework,
+            framework_version=report.framework_version,
+            organization=report.organization,
+            scan_date=report.scan_date,
+            auditor=report.auditor,
+            scan_target=report.scan_target,
+            executive_summary=report.executive_summary,
+            total_controls=total,
+            compliance_percentage=f"{report.compliance_percentage:.1f}",
+            compliant_controls=report.compliant_controls,
+            compliant_pct=f"{report.compliant_controls / total * 100:.1f}",
+            non_compliant_controls=report.non_compliant_controls,
+            non_compliant_pct=f"{report.non_compliant_controls / total * 100:.1f}",
+            needs_review_controls=report.needs_review_controls,
+            needs_review_pct=f"{report.needs_review_controls / total * 100:.1f}"
+        )]
         
         for evidence in report.detailed_findings:
-            status_emoji = {
-                "compliant": "✅",
-                "non_compliant": "❌", 
-                "needs_review": "⚠️"
-            }
-            
-            markdown_content += f"""### {status_emoji.get(evidence.status, "❓")} Control {evidence.control_id}
-
-**Scanner(s):** {evidence.scanner}  
-**Total Findings:** {evidence.finding_count}  
-**Status:** {evidence.status.replace('_', ' ').title()}
-
-**Finding Breakdown:**
-- Critical: {evidence.critical_count}
-- High: {evidence.high_count}  
-- Medium: {evidence.medium_count}
-- Low: {evidence.low_count}
-
-**Remediation Notes:**
-{evidence.remediation_notes}
-
-**Evidence Files:** {len(evidence.evidence_files)} file(s) analyzed
-
----
-
-"""
-        
-        markdown_content += f"""## Recommendations
-
-"""
+            parts.append(_MD_CONTROL.substitute(
+                status_emoji=_STATUS_EMOJI.get(evidence.status, "❓"),
+                control_id=evidence.control_id,
+                scanner=evidence.scanner,
+                finding_count=evidence.finding_count,
+                status=evidence.status.replace('_', ' ').title(),
+                critical_count=evidence.critical_count,
+                high_count=evidence.high_count,
+                medium_count=evidence.medium_count,
+                low_count=evidence.low_count,
+                remediation_notes=evidence.remediation_notes,
+                evidence_file_count=len(evidence.evidence_files)
+            ))
+        
+        parts.append(_MD_RECOMMENDATIONS_HEADER)
         for i, rec in enumerate(report.recommendations, 1):
-            markdown_content += f"{i}. {rec}\n"
+            parts.append(f"{i}. {rec}\n")
         
-        markdown_content += f"""
-
-## Auditor Attestation
-
-{report.attestation['auditor_statement']}
-
-**Methodology:** {report.attestation['methodology']}  
-**Scope:** {report.attestation['scope']}  
-**Limitations:** {report.attestation['limitations']}
-
-**Auditor:** {report.attestation['auditor']} ({report.attestation['auditor_title']})  
-**Organization:** {report.attestation['audit_firm']}  
-**Date:** {report.attestation['date']}
-
----
-
-*This report was generated by AuditHound - Automated Security Audit Platform*
-"""
+        parts.append(_MD_ATTESTATION.substitute(report.attestation))
         
-        with open(output_path, 'w') as f:
-            f.write(markdown_content)
\ No newline at end of file
+        return "".join(parts)
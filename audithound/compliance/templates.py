@@ -3,7 +3,6 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 from pathlib import Path
-import yaml
 
 
 @dataclass
@@ -20,8 +19,12 @@ class AuditTemplate:
     @classmethod
     def load_template(cls, template_path: Path) -> 'AuditTemplate':
         """Load audit template from file."""
-        with open(template_path, 'r') as f:
-            data = yaml.safe_load(f)
+        import yaml
+        
+        # Use the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(template_path, 'rb') as f:
+            data = yaml.load(f, Loader=loader)
         
         return cls(
             name=data['name'],
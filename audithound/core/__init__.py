@@ -1,7 +1,16 @@
 """Core functionality for AuditHound."""
 
+from typing import Any
+
 from .config import Config
-from .scanner import SecurityScanner
-from .types import ScanResult, AggregatedResults
+from .types import Finding, ScanResult, AggregatedResults
+
+__all__ = ["Config", "SecurityScanner", "Finding", "ScanResult", "AggregatedResults"]
+
 
-__all__ = ["Config", "SecurityScanner", "ScanResult", "AggregatedResults"]
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # The scanner orchestrator pulls in every adapter, so load it on first access
+    if name == "SecurityScanner":
+        from .scanner import SecurityScanner
+        return SecurityScanner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,93 @@
 """Configuration management for AuditHound."""
 
+import copy
+import fnmatch
+import hashlib
 import logging
 import os
+import re
+import tempfile
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Pattern, Tuple
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 
+from ..utils import jsonio
 
-@dataclass
+# Prefer the libyaml-backed implementations when PyYAML was built with them
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed configs keyed by (resolved path, mtime_ns, size)
+_CONFIG_CACHE: Dict[Tuple[str, int, int], "Config"] = {}
+
+
+def _sidecar_path(resolved_path: str) -> Path:
+    """Location of the JSON cache for a config file."""
+    cache_root = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    digest = hashlib.sha1(resolved_path.encode('utf-8')).hexdigest()
+    return cache_root / 'audithound' / f"{digest}.json"
+
+
+def _read_sidecar(resolved_path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the cached config data if it was written for this exact file version."""
+    try:
+        cached = jsonio.load_file(_sidecar_path(resolved_path))
+    except (OSError, ValueError):
+        return None
+    if (
+        isinstance(cached, dict)
+        and cached.get('src_mtime_ns') == st.st_mtime_ns
+        and cached.get('src_size') == st.st_size
+    ):
+        return cached.get('data')
+    return None
+
+
+def _write_sidecar(resolved_path: str, st: os.stat_result, data: Dict[str, Any]) -> None:
+    """Best-effort write of parsed config data to the JSON cache."""
+    sidecar = _sidecar_path(resolved_path)
+    payload = {'src_mtime_ns': st.st_mtime_ns, 'src_size': st.st_size, 'data': data}
+    try:
+        text = jsonio.dumps(payload)
+        if jsonio.loads(text)['data'] != data:
+            # JSON turns non-string YAML keys (ints, bools) into strings; a sidecar
+            # that loads differently from the YAML must not be written
+            return
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        tmp.write_text(text, encoding='utf-8')
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        # YAML values with no JSON equivalent or an unwritable cache dir just skip caching
+        pass
+
+
+@lru_cache(maxsize=64)
+def _compile_exclude_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Combine fnmatch-style globs into a single compiled regex."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+@dataclass(slots=True)
 class ScannerConfig:
     """Configuration for individual scanners."""
     enabled: bool = True
     args: List[str] = field(default_factory=list)
     exclude_patterns: List[str] = field(default_factory=list)
     severity_threshold: str = "medium"
+    
+    @property
+    def exclude_matcher(self) -> Optional[Pattern[str]]:
+        """Compiled regex matching any of the exclude patterns, or None if there are none."""
+        # Keyed on the current patterns so in-place edits are picked up
+        return _compile_exclude_patterns(tuple(self.exclude_patterns))
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     """Output configuration."""
     format: str = "json"
@@ -26,7 +96,12 @@ class OutputConfig:
     group_by_severity: bool = True
 
 
-@dataclass
+# Field names drive to_dict/from_dict so they stay in sync with the dataclasses
+_SCANNER_FIELDS = tuple(f.name for f in fields(ScannerConfig))
+_OUTPUT_FIELDS = tuple(f.name for f in fields(OutputConfig))
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration class for AuditHound."""
     
@@ -45,6 +120,12 @@ class Config:
     use_docker: bool = True
     docker_timeout: int = 300
     
+    # Result cache configuration; off by default because cached findings can hide
+    # advisories published since the last run. Entries older than cache_ttl seconds
+    # are ignored and pruned
+    cache_results: bool = False
+    cache_ttl: int = 86400
+    
     @classmethod
     def load(cls, config_file: Optional[Path] = None) -> "Config":
         """Load configuration from file or create default."""
@@ -53,9 +134,26 @@ class Config:
         if config_file and config_file.exists():
             logger.info(f"Loading configuration from {config_file}")
             try:
-                with open(config_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    return cls.from_dict(data)
+                st = config_file.stat()
+                resolved_path = str(config_file.resolve())
+                key = (resolved_path, st.st_mtime_ns, st.st_size)
+                cached = _CONFIG_CACHE.get(key)
+                if cached is not None:
+                    logger.debug(f"Using cached configuration for {config_file}")
+                    return copy.deepcopy(cached)
+                
+                # A JSON sidecar from an earlier run is much cheaper to parse than YAML
+                data = _read_sidecar(resolved_path, st)
+                if data is None:
+                    # libyaml reads incrementally from the binary stream
+                    with open(config_file, 'rb') as f:
+                        data = yaml.load(f, Loader=_YamlLoader)
+                    _write_sidecar(resolved_path, st, data)
+                else:
+                    logger.debug(f"Using JSON cache for {config_file}")
+                config = cls.from_dict(data)
+                _CONFIG_CACHE[key] = config
+                return copy.deepcopy(config)
             except Exception as e:
                 logger.error(f"Failed to load config from {config_file}: {e}")
                 logger.info("Falling back to default configuration")
@@ -67,27 +165,21 @@ class Config:
                 logger.info("No config file specified, using defaults")
             return cls.default()
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached configurations."""
+        _CONFIG_CACHE.clear()
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
         """Create Config from dictionary."""
-        config = cls()
-        
-        # Update basic fields
-        if 'target_path' in data:
-            config.target_path = data['target_path']
-        if 'exclude_paths' in data:
-            config.exclude_paths = data['exclude_paths']
-        if 'include_hidden' in data:
-            config.include_hidden = data['include_hidden']
-        if 'use_docker' in data:
-            config.use_docker = data['use_docker']
-        if 'docker_timeout' in data:
-            config.docker_timeout = data['docker_timeout']
+        config = cls(**{name: data[name] for name in _CONFIG_SCALAR_FIELDS if name in data})
         
         # Load scanner configurations
-        if 'scanners' in data:
-            for name, scanner_data in data['scanners'].items():
-                config.scanners[name] = ScannerConfig(**scanner_data)
+        config.scanners = {
+            name: ScannerConfig(**scanner_data)
+            for name, scanner_data in data.get('scanners', {}).items()
+        }
         
         # Load output configuration
         if 'output' in data:
@@ -144,11 +236,17 @@ class Config:
     @classmethod
     def validate(cls, config_file: Path) -> bool:
         """Validate configuration file."""
+        return cls.validate_fast(config_file)
+    
+    @staticmethod
+    def validate_fast(config_file: Path) -> bool:
+        """Check that a configuration file parses to a mapping without building a Config."""
         try:
-            cls.load(config_file)
-            return True
-        except Exception:
+            with open(config_file, 'rb') as f:
+                data = yaml.load(f, Loader=_YamlLoader)
+        except (OSError, yaml.YAMLError):
             return False
+        return isinstance(data, dict)
     
     def save(self, path: Path) -> None:
         """Save configuration to file."""
@@ -156,9 +254,29 @@ class Config:
         logger.info(f"Saving configuration to {path}")
         
         try:
-            data = self.to_dict()
-            with open(path, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, indent=2)
+            payload = self.to_yaml().encode('utf-8')
+            
+            # Write to a sibling temp file and rename over the target so a crash
+            # never leaves a truncated config behind
+            try:
+                mode = path.stat().st_mode & 0o777
+            except FileNotFoundError:
+                # New files get the permissions open() would have given them
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # mkstemp creates the file 0600; os.chmod (unlike os.fchmod) exists on every platform
+                os.chmod(tmp_name, mode)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
             logger.debug(f"Configuration saved successfully to {path}")
         except Exception as e:
             logger.error(f"Failed to save configuration to {path}: {e}")
@@ -166,29 +284,19 @@ class Config:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return {
-            'target_path': self.target_path,
-            'exclude_paths': self.exclude_paths,
-            'include_hidden': self.include_hidden,
-            'use_docker': self.use_docker,
-            'docker_timeout': self.docker_timeout,
-            'scanners': {
-                name: {
-                    'enabled': scanner.enabled,
-                    'args': scanner.args,
-                    'exclude_patterns': scanner.exclude_patterns,
-                    'severity_threshold': scanner.severity_threshold
-                }
-                for name, scanner in self.scanners.items()
-            },
-            'output': {
-                'format': self.output.format,
-                'file': self.output.file,
-                'include_passed': self.output.include_passed,
-                'group_by_severity': self.output.group_by_severity
-            }
+        data = {name: getattr(self, name) for name in _CONFIG_SCALAR_FIELDS}
+        data['scanners'] = {
+            name: {key: getattr(scanner, key) for key in _SCANNER_FIELDS}
+            for name, scanner in self.scanners.items()
         }
+        data['output'] = {key: getattr(self.output, key) for key in _OUTPUT_FIELDS}
+        return data
     
     def to_yaml(self) -> str:
         """Convert configuration to YAML string."""
-        return yaml.dump(self.to_dict(), default_flow_style=False, indent=2)
\ No newline at end of file
+        return yaml.dump(self.to_dict(), Dumper=_YamlDumper, default_flow_style=False, indent=2)
+
+
+_CONFIG_SCALAR_FIELDS = tuple(
+    f.name for f in fields(Config) if f.name not in ('scanners', 'output')
+)
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""On-disk cache of scanner findings for unchanged targets."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from ..utils import jsonio
+from .types import Finding
+
+# Secrets scanners report the live credential itself, which must never be written to disk
+_UNCACHEABLE_SCANNERS = frozenset({'trufflehog'})
+
+
+def _cache_dir(scanner_name: str) -> Path:
+    """Directory holding cached results for one scanner."""
+    cache_root = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return cache_root / 'audithound' / 'results' / scanner_name
+
+
+def is_cacheable(scanner_name: str) -> bool:
+    """Whether a scanner's findings may be persisted."""
+    return scanner_name not in _UNCACHEABLE_SCANNERS
+
+
+def tree_fingerprint(target: Path) -> str:
+    """Hash of every file's relative path, mtime and size under target."""
+    # The whole tree is hashed because scanners see all of it; Config.exclude_paths
+    # does not narrow what any scanner reads
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(target):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            try:
+                st = os.stat(path, follow_symlinks=False)
+            except OSError:
+                continue
+            entries.append(f"{os.path.relpath(path, target)}\0{st.st_mtime_ns}\0{st.st_size}")
+    return hashlib.blake2b('\n'.join(entries).encode('utf-8', errors='surrogateescape'),
+                           digest_size=16).hexdigest()
+
+
+def cache_key(scanner_name: str, scanner_version: str, scanner_setup: str,
+              target: Path, tree_digest: str) -> str:
+    """Key identifying a scan of one target state with one scanner setup."""
+    material = '\0'.join((scanner_name, scanner_version, scanner_setup, str(target), tree_digest))
+    return hashlib.blake2b(material.encode('utf-8', errors='surrogateescape'), digest_size=16).hexdigest()
+
+
+def _prune_expired(directory: Path, ttl: int) -> None:
+    """Delete cache entries in directory last written more than ttl seconds ago."""
+    cutoff = time.time() - ttl
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+
+def load(scanner_name: str, key: str, ttl: int) -> Optional[List[Finding]]:
+    """Return cached findings for key if present and younger than ttl seconds."""
+    if not is_cacheable(scanner_name):
+        return None
+    directory = _cache_dir(scanner_name)
+    _prune_expired(directory, ttl)
+    try:
+        cached = jsonio.load_file(directory / f"{key}.json")
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or time.time() - cached.get('created', 0) > ttl:
+        return None
+    try:
+        return [Finding.from_dict(finding) for finding in cached.get('findings', ())]
+    except (AttributeError, TypeError):
+        # Entries that no longer fit the Finding layout are treated as a miss
+        return None
+
+
+def store(scanner_name: str, key: str, findings: List[Finding], ttl: int) -> None:
+    """Best-effort write of findings to the cache, readable by the owner only."""
+    if not is_cacheable(scanner_name):
+        return
+    directory = _cache_dir(scanner_name)
+    path = directory / f"{key}.json"
+    payload = {'created': time.time(), 'findings': [dict(finding) for finding in findings]}
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _prune_expired(directory, ttl)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        data = jsonio.dumps(payload, default=str).encode('utf-8')
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        pass
@@ -1,23 +1,25 @@
 """Security scanner core functionality."""
 
+import asyncio
 import json
 import logging
+import os
 import subprocess
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from . import result_cache
 from .config import Config
 from .types import ScanResult, AggregatedResults
-from ..scanners.base import BaseScanner
+from ..scanners.base import BaseScanner, probe_all
 from ..scanners.bandit import BanditScanner
 from ..scanners.safety import SafetyScanner
 from ..scanners.semgrep import SemgrepScanner
 from ..scanners.trufflehog import TrufflehogScanner
 from ..scanners.checkov import CheckovScanner
 from ..utils.output import OutputFormatter
-from ..utils.docker import DockerRunner
 
 
 class SecurityScanner:
@@ -29,6 +31,8 @@ class SecurityScanner:
         
         if config.use_docker:
             self.logger.info("Initializing Docker runner for scanners")
+            # The Docker SDK is only imported when containers are actually used
+            from ..utils.docker import DockerRunner
             self.docker_runner = DockerRunner()
         else:
             self.logger.info("Using local scanner binaries")
@@ -48,14 +52,19 @@ class SecurityScanner:
     
     def scan(self, target: str, tools: Optional[List[str]] = None) -> AggregatedResults:
         """Run security scan on target directory or repository."""
-        target_path = Path(target).resolve()
-        
-        if not target_path.exists():
+        return asyncio.run(self.scan_async(target, tools))
+    
+    async def scan_async(self, target: str, tools: Optional[List[str]] = None) -> AggregatedResults:
+        """Run security scan with all scanners awaited concurrently on one event loop."""
+        # A strict resolve already walks the path, so it doubles as the existence check
+        try:
+            target_path = Path(target).resolve(strict=True)
+        except FileNotFoundError:
             self.logger.error(f"Target path does not exist: {target}")
-            raise FileNotFoundError(f"Target path does not exist: {target}")
+            raise FileNotFoundError(f"Target path does not exist: {target}") from None
         
         # Determine which scanners to run
-        scanners_to_run = self._get_enabled_scanners(tools)
+        scanners_to_run = await self._get_enabled_scanners(tools)
         
         if not scanners_to_run:
             self.logger.error("No scanners enabled or available")
@@ -64,35 +73,37 @@ class SecurityScanner:
         self.logger.info(f"Starting scan of {target} with {len(scanners_to_run)} scanners: {list(scanners_to_run.keys())}")
         print(f"🔍 Scanning {target} with {len(scanners_to_run)} scanners...")
         
-        # Run scanners
-        results_by_scanner = {}
+        # One walk of the target serves every scanner's cache key
+        tree_digest = None
+        if self.config.cache_results and any(map(result_cache.is_cacheable, scanners_to_run)):
+            tree_digest = await asyncio.to_thread(result_cache.tree_fingerprint, target_path)
         
-        if len(scanners_to_run) == 1:
-            # Run single scanner synchronously
-            scanner_name = list(scanners_to_run.keys())[0]
-            scanner = scanners_to_run[scanner_name]
-            results_by_scanner[scanner_name] = self._run_single_scanner(
-                scanner_name, scanner, target_path
-            )
-        else:
-            # Run multiple scanners in parallel
-            with ThreadPoolExecutor(max_workers=min(len(scanners_to_run), 4)) as executor:
-                future_to_scanner = {
-                    executor.submit(self._run_single_scanner, name, scanner, target_path): name
-                    for name, scanner in scanners_to_run.items()
-                }
-                
-                for future in as_completed(future_to_scanner):
-                    scanner_name = future_to_scanner[future]
-                    try:
-                        results_by_scanner[scanner_name] = future.result()
-                    except Exception as e:
-                        results_by_scanner[scanner_name] = ScanResult(
-                            scanner=scanner_name,
-                            target=str(target_path),
-                            status="error",
-                            error_message=str(e)
-                        )
+        # Scanner processes are CPU-heavy, so run at most one per core at a time
+        limit = asyncio.Semaphore(min(len(scanners_to_run), os.cpu_count() or 1))
+        
+        async def run_limited(name: str, scanner: BaseScanner) -> ScanResult:
+            async with limit:
+                # Scanners block on their subprocess or container, so each runs in a worker thread
+                return await asyncio.to_thread(self._run_single_scanner, name, scanner, target_path, tree_digest)
+        
+        outcomes = await asyncio.gather(
+            *(run_limited(name, scanner) for name, scanner in scanners_to_run.items()),
+            return_exceptions=True
+        )
+        
+        results_by_scanner = {}
+        for scanner_name, outcome in zip(scanners_to_run, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                outcome = ScanResult(
+                    scanner=scanner_name,
+                    target=str(target_path),
+                    status="error",
+                    error_message=str(outcome)
+                )
+            results_by_scanner[scanner_name] = outcome
+        
+        # Report every scanner from this thread in one write so parallel runs never interleave
+        print("\n".join(self._format_scanner_outcome(result) for result in results_by_scanner.values()))
         
         # Aggregate results
         total_findings = sum(len(result.findings) for result in results_by_scanner.values())
@@ -107,7 +118,7 @@ class SecurityScanner:
         print(f"✅ Scan completed! Found {total_findings} findings across {len(scanners_to_run)} scanners.")
         return aggregated
     
-    def _get_enabled_scanners(self, tools: Optional[List[str]] = None) -> Dict[str, BaseScanner]:
+    async def _get_enabled_scanners(self, tools: Optional[List[str]] = None) -> Dict[str, BaseScanner]:
         """Get enabled scanners based on configuration and tool selection."""
         scanners = {}
         
@@ -121,41 +132,63 @@ class SecurityScanner:
                 if config.enabled
             }
         
-        # Initialize requested scanners that are available
+        # Initialize requested scanners
+        candidates = {}
         for scanner_name in requested_scanners:
             if scanner_name in self.available_scanners:
                 scanner_class = self.available_scanners[scanner_name]
                 scanner_config = self.config.scanners.get(scanner_name)
                 
                 if scanner_config:
-                    scanner = scanner_class(
+                    candidates[scanner_name] = scanner_class(
                         config=scanner_config,
                         docker_runner=self.docker_runner
                     )
-                    
-                    # Check if scanner is available
-                    if scanner.is_available():
-                        scanners[scanner_name] = scanner
-                    else:
-                        print(f"⚠️  Scanner '{scanner_name}' is not available (not installed)")
                 else:
                     print(f"⚠️  No configuration found for scanner '{scanner_name}'")
             else:
                 print(f"⚠️  Unknown scanner: '{scanner_name}'")
         
+        # Check which scanners are available, probing them all concurrently
+        probes = await probe_all(list(candidates.values()))
+        for (scanner_name, scanner), (available, _) in zip(candidates.items(), probes, strict=True):
+            if available:
+                scanners[scanner_name] = scanner
+            else:
+                print(f"⚠️  Scanner '{scanner_name}' is not available (not installed)")
+        
         return scanners
     
-    def _run_single_scanner(self, name: str, scanner: BaseScanner, target: Path) -> ScanResult:
+    def _run_single_scanner(self, name: str, scanner: BaseScanner, target: Path,
+                            tree_digest: Optional[str] = None) -> ScanResult:
         """Run a single scanner and return its results."""
-        print(f"🔍 Running {name} scanner...")
+        self.logger.info(f"Running {name} scanner")
         
-        start_time = datetime.now()
+        start_time = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
         
         try:
-            # Run the scanner
-            findings = scanner.scan(target)
+            # Reuse findings from an earlier run over the same files and scanner setup;
+            # the version is only probed up front when it is part of a cache key
+            version = None
+            findings = None
+            key = None
+            if tree_digest is not None and result_cache.is_cacheable(name):
+                version = scanner.get_version()
+                setup = f"{scanner.config!r} docker={scanner.docker_runner is not None}"
+                key = result_cache.cache_key(name, version, setup, target, tree_digest)
+                findings = result_cache.load(name, key, self.config.cache_ttl)
+            
+            cached = findings is not None
+            if cached:
+                self.logger.info(f"{name}: using cached results")
+            else:
+                # Run the scanner
+                findings = scanner.scan(target)
+                if key is not None:
+                    result_cache.store(name, key, findings, self.config.cache_ttl)
             
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             
             result = ScanResult(
                 scanner=name,
@@ -164,17 +197,18 @@ class SecurityScanner:
                 findings=findings,
                 duration=duration,
                 metadata={
-                    'scanner_version': scanner.get_version(),
-                    'scan_time': start_time.isoformat()
+                    'scanner_version': version if version is not None else scanner.get_version(),
+                    'scan_time': start_time.isoformat(),
+                    'cached': cached
                 }
             )
             
-            print(f"✅ {name}: Found {len(findings)} findings in {duration:.1f}s")
+            self.logger.info(f"{name}: found {len(findings)} findings in {duration:.1f}s")
             return result
             
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
-            print(f"❌ {name}: Failed after {duration:.1f}s - {str(e)}")
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            self.logger.warning(f"{name}: failed after {duration:.1f}s - {e}")
             
             return ScanResult(
                 scanner=name,
@@ -184,17 +218,22 @@ class SecurityScanner:
                 duration=duration
             )
     
+    def _format_scanner_outcome(self, result: ScanResult) -> str:
+        """One-line progress summary for a finished scanner."""
+        if result.status == "success":
+            return f"✅ {result.scanner}: Found {len(result.findings)} findings in {result.duration:.1f}s"
+        return f"❌ {result.scanner}: Failed after {result.duration:.1f}s - {result.error_message}"
+    
     def export_results(self, results: AggregatedResults, output_path: Union[str, Path]) -> None:
         """Export scan results to file."""
         output_file = Path(output_path)
-        formatted_output = self.formatter.format(results)
         
         # Ensure output directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write formatted results
-        with open(output_file, 'w') as f:
-            f.write(formatted_output)
+        # Stream formatted results through a large buffer to keep write calls few
+        with open(output_file, 'wb', buffering=1024 * 1024) as f:
+            self.formatter.write(results, f)
         
         print(f"📄 Results exported to: {output_file}")
     
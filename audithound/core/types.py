@@ -1,24 +1,103 @@
 """Type definitions for AuditHound core functionality."""
 
+import sys
+from collections import Counter
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 
 
-@dataclass
+# Keys every scanner emits, in the order scanners have always written them
+_FINDING_FIELDS = ('scanner', 'rule_id', 'rule_name', 'severity', 'message', 'file', 'line')
+_FINDING_FIELD_SET = frozenset(_FINDING_FIELDS)
+
+# Canonical severity strings, so every finding shares the same few objects
+_SEVERITY_INTERN = {
+    severity: sys.intern(severity)
+    for severity in ('critical', 'high', 'medium', 'low', 'info', 'unknown')
+}
+
+
+# eq=False keeps Mapping equality, so a Finding compares equal to the equivalent dict
+@dataclass(slots=True, eq=False)
+class Finding(Mapping):
+    """A single scanner finding.
+    
+    Common keys are stored in slots and scanner-specific keys in ``extra``.
+    Instances also behave as a read-only mapping so code written against
+    plain finding dicts keeps working; a field set to None reads as missing.
+    """
+    scanner: str
+    rule_id: Optional[str] = None
+    rule_name: Optional[str] = None
+    severity: Optional[str] = None
+    message: Optional[str] = None
+    file: Optional[str] = None
+    line: Optional[Any] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        """Intern the low-cardinality string fields."""
+        self.scanner = sys.intern(self.scanner)
+        if isinstance(self.severity, str):
+            self.severity = _SEVERITY_INTERN.get(self.severity) or sys.intern(self.severity)
+        if isinstance(self.rule_id, str):
+            self.rule_id = sys.intern(self.rule_id)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Finding":
+        """Create a Finding from a scanner's finding dict."""
+        extra = {key: value for key, value in data.items() if key not in _FINDING_FIELD_SET}
+        return cls(*(data.get(key) for key in _FINDING_FIELDS), extra=extra)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain finding dict."""
+        return dict(self)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, or default if it is missing."""
+        if key in _FINDING_FIELD_SET:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extra.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in _FINDING_FIELD_SET:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        return self.extra[key]
+    
+    def __iter__(self):
+        for key in _FINDING_FIELDS:
+            if getattr(self, key) is not None:
+                yield key
+        yield from self.extra
+    
+    def __len__(self) -> int:
+        return sum(getattr(self, key) is not None for key in _FINDING_FIELDS) + len(self.extra)
+
+
+@dataclass(slots=True)
 class ScanResult:
     """Result from a security scan."""
     scanner: str
     target: str
     status: str  # success, error, skipped
-    findings: List[Dict[str, Any]] = field(default_factory=list)
+    findings: List[Finding] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     error_message: Optional[str] = None
     duration: float = 0.0
+    
+    def __post_init__(self):
+        """Intern the scanner name shared by every result for this scanner."""
+        self.scanner = sys.intern(self.scanner)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedResults:
     """Aggregated results from all scanners."""
     target: str
@@ -29,18 +108,15 @@ class AggregatedResults:
     
     def __post_init__(self):
         """Calculate summary statistics."""
+        severities = Counter(
+            (finding.get('severity') or 'unknown').lower()
+            for result in self.results_by_scanner.values()
+            for finding in result.findings
+        )
+        
+        # Unknown severities count towards the total only
         self.summary = {
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0,
-            'info': 0,
-            'total': 0
+            severity: severities[severity]
+            for severity in ('critical', 'high', 'medium', 'low', 'info')
         }
-        
-        for result in self.results_by_scanner.values():
-            for finding in result.findings:
-                severity = finding.get('severity', 'unknown').lower()
-                if severity in self.summary:
-                    self.summary[severity] += 1
-                self.summary['total'] += 1
\ No newline at end of file
+        self.summary['total'] = sum(severities.values())
@@ -1,14 +1,14 @@
 """Main entry point for AuditHound application."""
 
+import os
 import typer
+from collections import namedtuple
 from rich.console import Console
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
-from .tui.app import AuditHoundTUI
-from .core.scanner import SecurityScanner
-from .core.config import Config
-from .utils.logging_config import configure_for_cli, configure_for_tui
+if TYPE_CHECKING:
+    from .core.config import Config
 
 app = typer.Typer(
     name="audithound",
@@ -18,6 +18,12 @@ app = typer.Typer(
 
 console = Console()
 
+# Read size used when scanning the log file backwards
+_LOG_CHUNK_SIZE = 8192
+
+# Stand-in for a scanner result in the demo audit data
+_ScanStub = namedtuple('_ScanStub', ['findings'])
+
 
 @app.command()
 def scan(
@@ -31,8 +37,11 @@ def scan(
     docker: Optional[bool] = typer.Option(None, "--docker/--no-docker", help="Use Docker for scanners"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimize output"),
+    cache: Optional[bool] = typer.Option(None, "--cache/--no-cache", help="Reuse and store scanner results for unchanged targets"),
 ):
     """Run security audit scan on target directory or repository."""
+    from .core.config import Config
+    from .utils.logging_config import configure_for_cli, configure_for_tui
     
     # Setup logging first
     if interactive:
@@ -50,20 +59,12 @@ def scan(
         config = Config.load(config_file)
         
         # Override config with CLI arguments
-        if format:
-            config.output.format = format
-        if output:
-            config.output.file = str(output)
-        if docker is not None:
-            config.use_docker = docker
-        if severity:
-            # Apply severity threshold to all enabled scanners
-            for scanner_config in config.scanners.values():
-                if scanner_config.enabled:
-                    scanner_config.severity_threshold = severity
+        _apply_scan_overrides(config, format, output, docker, cache, severity)
         
         if interactive:
             # Launch TUI application
+            from .tui.app import AuditHoundTUI
+            
             console.print("🚀 Launching AuditHound TUI...")
             tui_app = AuditHoundTUI(
                 target=target,
@@ -78,6 +79,7 @@ def scan(
             # Run headless scan
             console.print(f"🔍 Starting headless scan of [cyan]{target}[/cyan]")
             
+            from .core.scanner import SecurityScanner
             scanner = SecurityScanner(config)
             results = scanner.scan(target, tools)
             
@@ -95,6 +97,25 @@ def scan(
         raise typer.Exit(1)
 
 
+def _apply_scan_overrides(config: "Config", format: Optional[str], output: Optional[Path],
+                          docker: Optional[bool], cache: Optional[bool],
+                          severity: Optional[str]) -> None:
+    """Apply the scan command's CLI options on top of the loaded configuration."""
+    if format:
+        config.output.format = format
+    if output:
+        config.output.file = str(output)
+    if docker is not None:
+        config.use_docker = docker
+    if cache is not None:
+        config.cache_results = cache
+    if severity:
+        # Apply severity threshold to all enabled scanners
+        for scanner_config in config.scanners.values():
+            if scanner_config.enabled:
+                scanner_config.severity_threshold = severity
+
+
 @app.command()
 def config(
     init: bool = typer.Option(False, "--init", help="Initialize default configuration"),
@@ -103,6 +124,7 @@ def config(
     path: str = typer.Option("audithound.yaml", "--path", "-p", help="Configuration file path")
 ):
     """Manage AuditHound configuration."""
+    from .core.config import Config
     
     if init:
         config_path = Path(path)
@@ -154,19 +176,7 @@ def tools(
     
     if check:
         console.print("[cyan]🔍 Checking Scanner Availability:[/cyan]")
-        
-        # Load default config to get scanners
-        config = Config.default()
-        scanner = SecurityScanner(config)
-        
-        for name, scanner_class in scanner.available_scanners.items():
-            scanner_instance = scanner_class(config.scanners[name], scanner.docker_runner)
-            
-            if scanner_instance.is_available():
-                version = scanner_instance.get_version()
-                console.print(f"  [green]✅ {name}[/green] - Version: {version}")
-            else:
-                console.print(f"  [red]❌ {name}[/red] - Not available")
+        _check_scanner_availability()
     
     if docker_images:
         console.print("[cyan]🐳 Docker Images for Scanners:[/cyan]")
@@ -179,6 +189,40 @@ def tools(
             console.print(f"  [blue]{scanner}[/blue]: {image}")
 
 
+def _check_scanner_availability() -> None:
+    """Probe every enabled scanner concurrently and print whether it is available."""
+    import asyncio
+
+    from .core.config import Config
+    from .core.scanner import SecurityScanner
+    from .scanners.base import probe_all
+    
+    # Honour the project's config when there is one; load() falls back to defaults
+    config = Config.load(Path("audithound.yaml"))
+    scanner = SecurityScanner(config)
+    
+    instances = {}
+    for name, scanner_class in scanner.available_scanners.items():
+        scanner_config = config.scanners.get(name)
+        # Skip the availability probe for scanners the user has turned off
+        if scanner_config is not None and scanner_config.enabled:
+            instances[name] = scanner_class(scanner_config, scanner.docker_runner)
+    
+    # Run every probe at once rather than one scanner after another
+    probes = dict(zip(instances, asyncio.run(probe_all(list(instances.values()))), strict=True))
+    
+    for name in scanner.available_scanners:
+        if name not in probes:
+            console.print(f"  [dim]⏭  {name}[/dim] - Disabled in config")
+            continue
+        
+        available, version = probes[name]
+        if available:
+            console.print(f"  [green]✅ {name}[/green] - Version: {version}")
+        else:
+            console.print(f"  [red]❌ {name}[/red] - Not available")
+
+
 @app.command()
 def audit(
     target: str = typer.Argument(help="Target directory to audit"),
@@ -240,7 +284,8 @@ def audit(
     console.print(f"🔧 Scanners: {', '.join(tools_list)}")
     
     try:
-        with Progress() as progress:
+        # Share the module console so Rich doesn't probe the terminal a second time
+        with Progress(console=console, transient=True) as progress:
             scan_task = progress.add_task("Running security scan...", total=100)
             
             scanner = SecurityScanner(audit_config)
@@ -265,16 +310,16 @@ def audit(
                 'scanners_used': tools_list,
                 'scan_date': datetime.now().isoformat(),
                 'results_by_scanner': {
-                    'bandit': type('obj', (object,), {'findings': [
+                    'bandit': _ScanStub(findings=[
                         {'severity': 'high', 'file': 'app.py', 'message': 'Hardcoded password'},
                         {'severity': 'medium', 'file': 'utils.py', 'message': 'SQL injection risk'}
-                    ]})(),
-                    'safety': type('obj', (object,), {'findings': [
+                    ]),
+                    'safety': _ScanStub(findings=[
                         {'severity': 'high', 'file': 'requirements.txt', 'message': 'Vulnerable dependency'}
-                    ]})(),
-                    'trufflehog': type('obj', (object,), {'findings': [
+                    ]),
+                    'trufflehog': _ScanStub(findings=[
                         {'severity': 'critical', 'file': '.env', 'message': 'API key detected'}
-                    ]})()
+                    ])
                 }
             }
             
@@ -312,6 +357,9 @@ def tui(
     theme: str = typer.Option("default", "--theme", help="UI theme (default, dark, light, high_contrast, security)"),
 ):
     """Launch the interactive TUI interface."""
+    from .core.config import Config
+    from .tui.app import AuditHoundTUI
+    from .utils.logging_config import configure_for_tui
     
     # Setup TUI-optimized logging
     configure_for_tui()
@@ -388,192 +436,79 @@ def logs(
             console.print("\n[yellow]Stopped following logs[/yellow]")
     else:
         try:
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                
-            if level:
-                lines = [line for line in lines if level.upper() in line]
-            
-            recent_lines = lines[-tail:] if len(lines) > tail else lines
+            recent_lines = _tail_log_lines(log_file, tail, level)
             
             console.print(f"[cyan]Showing last {len(recent_lines)} lines:[/cyan]")
             for line in recent_lines:
-                line = line.rstrip()
-                if 'ERROR' in line:
-                    console.print(f"[red]{line}[/red]")
-                elif 'WARNING' in line:
-                    console.print(f"[yellow]{line}[/yellow]")
-                elif 'DEBUG' in line:
-                    console.print(f"[dim]{line}[/dim]")
-                else:
-                    console.print(line)
+                _print_log_line(line)
                     
         except Exception as e:
             console.print(f"[red]❌ Error reading log file: {e}[/red]")
 
 
+def _tail_log_lines(log_file: Path, count: int, level: Optional[str] = None) -> List[str]:
+    """Return the last count lines containing level, reading the file backwards in chunks."""
+    needle = level.upper().encode('utf-8') if level else None
+    matched: List[bytes] = []
+    
+    with open(log_file, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        pending = b''
+        
+        while position > 0 and (count <= 0 or len(matched) < count):
+            step = min(_LOG_CHUNK_SIZE, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + pending
+            if needle is not None and needle not in data:
+                # One C-level substring scan rules out the whole chunk; only the
+                # leading partial line needs to be carried over
+                newline = data.find(b'\n')
+                pending = data if newline < 0 else data[:newline]
+                continue
+            pieces = data.split(b'\n')
+            if position + step == end and pieces[-1] == b'':
+                # Trailing newline at end of file does not start another line
+                pieces.pop()
+            
+            # The first piece may continue in the previous chunk
+            pending = pieces[0]
+            for line in reversed(pieces[1:]):
+                if needle is None or needle in line:
+                    matched.append(line)
+        
+        if position == 0 and end > 0 and (count <= 0 or len(matched) < count):
+            if needle is None or needle in pending:
+                matched.append(pending)
+    
+    if count > 0:
+        matched = matched[:count]
+    return [line.decode('utf-8', errors='replace') for line in reversed(matched)]
+
+
+def _print_log_line(line: str) -> None:
+    """Print a log line colored by its level."""
+    line = line.rstrip()
+    if 'ERROR' in line:
+        console.print(f"[red]{line}[/red]")
+    elif 'WARNING' in line:
+        console.print(f"[yellow]{line}[/yellow]")
+    elif 'DEBUG' in line:
+        console.print(f"[dim]{line}[/dim]")
+    else:
+        console.print(line)
+
+
 @app.command()
 def example(
     output_dir: str = typer.Option("./audithound-example", "--output", "-o", help="Output directory for example")
 ):
     """Create example configuration and sample vulnerable code for testing."""
+    from .cli.example import write_example
     
     output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
-    
-    # Create example config
-    Config.create_default(str(output_path / "audithound.yaml"))
-    
-    # Create sample vulnerable Python code
-    vulnerable_py = '''
-import os
-import pickle
-import sqlite3
-from flask import Flask, request
-
-app = Flask(__name__)
-
-# Hardcoded credentials (bandit will catch this)
-API_KEY = "sk-1234567890abcdef"
-DATABASE_PASSWORD = "admin123"
-
-# SQL Injection vulnerability
-def get_user(user_id):
-    conn = sqlite3.connect("users.db")
-    cursor = conn.cursor()
-    # Vulnerable to SQL injection
-    query = f"SELECT * FROM users WHERE id = {user_id}"
-    cursor.execute(query)
-    return cursor.fetchone()
-
-# Command injection vulnerability
-@app.route('/ping')
-def ping():
-    host = request.args.get('host', 'localhost')
-    # Vulnerable to command injection
-    result = os.system(f'ping -c 1 {host}')
-    return f"Ping result: {result}"
-
-# Pickle deserialization vulnerability
-def load_config(config_data):
-    # Dangerous use of pickle
-    return pickle.loads(config_data)
-
-# Weak random generation
-def generate_token():
-    import random
-    return random.randint(1000, 9999)
-
-if __name__ == "__main__":
-    app.run(debug=True, host='0.0.0.0')  # Debug mode in production
-'''
-    
-    # Create sample Dockerfile with security issues
-    dockerfile = '''
-FROM ubuntu:latest
-
-# Running as root (security issue)
-USER root
-
-# Installing packages without specific versions
-RUN apt-get update && apt-get install -y \\
-    python3 \\
-    python3-pip \\
-    curl \\
-    wget
-
-# Copying secrets into image (bad practice)
-COPY secret_key.txt /app/
-
-# Setting weak permissions
-RUN chmod 777 /app
-
-# Exposing unnecessary ports
-EXPOSE 22 80 443 8080 9000
-
-# Running with elevated privileges
-CMD ["python3", "app.py"]
-'''
-    
-    # Create sample requirements.txt with vulnerable packages
-    requirements = '''
-Django==2.0.0
-requests==2.20.0
-Pillow==5.0.0
-PyYAML==3.13
-Jinja2==2.10
-'''
-    
-    # Create sample Kubernetes manifest with security issues
-    k8s_manifest = '''
-apiVersion: v1
-kind: Pod
-metadata:
-  name: vulnerable-pod
-spec:
-  containers:
-  - name: app
-    image: nginx:latest
-    securityContext:
-      privileged: true
-      runAsUser: 0
-    env:
-    - name: API_KEY
-      value: "hardcoded-secret-key"
-    ports:
-    - containerPort: 80
-    volumeMounts:
-    - name: host-root
-      mountPath: /host
-  volumes:
-  - name: host-root
-    hostPath:
-      path: /
-'''
-    
-    # Write example files
-    (output_path / "vulnerable_app.py").write_text(vulnerable_py)
-    (output_path / "Dockerfile").write_text(dockerfile)
-    (output_path / "requirements.txt").write_text(requirements)
-    (output_path / "k8s-pod.yaml").write_text(k8s_manifest)
-    (output_path / "secret_key.txt").write_text("super-secret-api-key-12345")
-    
-    # Create README
-    readme = f'''# AuditHound Example
-
-This directory contains example vulnerable code for testing AuditHound scanners.
-
-## Files included:
-- `audithound.yaml` - Example configuration
-- `vulnerable_app.py` - Python code with security vulnerabilities
-- `Dockerfile` - Docker configuration with security issues
-- `requirements.txt` - Python dependencies with known vulnerabilities
-- `k8s-pod.yaml` - Kubernetes manifest with security misconfigurations
-- `secret_key.txt` - Hardcoded secret file
-
-## How to scan:
-```bash
-# Interactive mode
-audithound scan {output_dir}
-
-# Headless mode with JSON output
-audithound scan {output_dir} --no-interactive --output results.json
-
-# Scan with specific tools only
-audithound scan {output_dir} --tools bandit,safety --no-interactive
-```
-
-## Expected findings:
-- **Bandit**: Hardcoded credentials, SQL injection, command injection, pickle usage
-- **Safety**: Vulnerable Python packages in requirements.txt
-- **Semgrep**: Code quality and security patterns
-- **TruffleHog**: Hardcoded secrets in files
-- **Checkov**: Dockerfile and Kubernetes security misconfigurations
-
-⚠️  **Warning**: This code is intentionally vulnerable and should not be used in production!
-'''
-    
-    (output_path / "README.md").write_text(readme)
+    write_example(output_path, output_dir)
     
     console.print(f"[green]✅ Example created in: {output_path}[/green]")
     console.print("[yellow]📝 See README.md for scanning instructions[/yellow]")
@@ -1,10 +1,21 @@
 """Bandit security scanner implementation."""
 
-import json
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from .base import BaseScanner
+from ..core.types import Finding
+from ..utils import jsonio
+
+_CWE_RE = re.compile(r'CWE[-\s]?(\d+)', re.IGNORECASE)
+
+# Bandit severity to standard severity levels
+_SEVERITY_MAP = {
+    'LOW': 'low',
+    'MEDIUM': 'medium',
+    'HIGH': 'high'
+}
 
 
 class BanditScanner(BaseScanner):
@@ -16,24 +27,14 @@ class BanditScanner(BaseScanner):
     def get_docker_image(self) -> str:
         return "pipelinecomponents/bandit:latest"
     
-    def scan(self, target: Path) -> List[Dict[str, Any]]:
+    def scan(self, target: Path) -> List[Finding]:
         """Run Bandit scanner on Python files."""
         cmd = self.get_command(target)
         
-        try:
-            output = self.run_command(cmd, target)
-            findings = self.parse_output(output)
-            return self.filter_by_severity(findings)
-        except Exception as e:
-            # Bandit returns non-zero exit code when issues are found
-            # Try to parse output anyway
-            if hasattr(e, 'output') and e.output:
-                try:
-                    findings = self.parse_output(e.output)
-                    return self.filter_by_severity(findings)
-                except:
-                    pass
-            raise
+        # Non-zero exits still return the report, so the output is parsed once
+        # Raw bytes go straight to the JSON parser without a full-size decode
+        output = self.run_command(cmd, target, text=False)
+        return self.parse_output(output)
     
     def get_command(self, target: Path) -> List[str]:
         """Get Bandit command."""
@@ -49,61 +50,58 @@ class BanditScanner(BaseScanner):
         
         return cmd
     
-    def parse_output(self, output: str) -> List[Dict[str, Any]]:
+    def parse_output(self, output: Union[str, bytes]) -> List[Finding]:
         """Parse Bandit JSON output."""
-        findings = []
-        
         try:
-            data = json.loads(output)
-            
-            for result in data.get('results', []):
-                finding = {
-                    'scanner': 'bandit',
-                    'rule_id': result.get('test_id', 'unknown'),
-                    'rule_name': result.get('test_name', 'unknown'),
-                    'severity': self._map_severity(result.get('issue_severity', 'MEDIUM')),
+            data = jsonio.loads(output)
+        except jsonio.JSONDecodeError:
+            # If JSON parsing fails, try to extract info from text output
+            if isinstance(output, bytes):
+                output = output.decode('utf-8', errors='replace')
+            return self._parse_text_output(output)
+        
+        # Findings below the threshold are dropped before their Finding is built
+        return [
+            Finding(
+                scanner='bandit',
+                rule_id=result.get('test_id', 'unknown'),
+                rule_name=result.get('test_name', 'unknown'),
+                severity=severity,
+                message=result.get('issue_text', ''),
+                file=result.get('filename', ''),
+                line=result.get('line_number', 0),
+                extra={
                     'confidence': result.get('issue_confidence', 'MEDIUM').lower(),
-                    'message': result.get('issue_text', ''),
-                    'file': result.get('filename', ''),
-                    'line': result.get('line_number', 0),
                     'column': result.get('col_offset', 0),
                     'code': result.get('code', ''),
                     'cwe': self._extract_cwe(result),
                     'references': self._get_references(result)
                 }
-                findings.append(finding)
-                
-        except json.JSONDecodeError:
-            # If JSON parsing fails, try to extract info from text output
-            findings = self._parse_text_output(output)
-        
-        return findings
+            )
+            for result in data.get('results', ())
+            if self.meets_severity_threshold(
+                severity := self._map_severity(result.get('issue_severity', 'MEDIUM'))
+            )
+        ]
     
     def _map_severity(self, bandit_severity: str) -> str:
         """Map Bandit severity to standard severity levels."""
-        severity_map = {
-            'LOW': 'low',
-            'MEDIUM': 'medium',
-            'HIGH': 'high'
-        }
-        return severity_map.get(bandit_severity.upper(), 'medium')
+        # Reports use upper-case levels, so the exact lookup almost always hits
+        severity = _SEVERITY_MAP.get(bandit_severity)
+        if severity is None:
+            severity = _SEVERITY_MAP.get(bandit_severity.upper(), 'medium')
+        return severity
     
     def _extract_cwe(self, result: Dict[str, Any]) -> List[str]:
         """Extract CWE identifiers from result."""
-        cwe_list = []
-        
-        # Look for CWE in various fields
-        test_name = result.get('test_name', '')
-        issue_text = result.get('issue_text', '')
-        
-        import re
-        cwe_pattern = r'CWE[-\s]?(\d+)'
-        
-        for text in [test_name, issue_text]:
-            matches = re.findall(cwe_pattern, text, re.IGNORECASE)
-            cwe_list.extend([f'CWE-{match}' for match in matches])
-        
-        return list(set(cwe_list))
+        # Look for CWE in various fields; deduplicated, in order of first appearance.
+        # Most findings never mention a CWE, so a substring test skips the regex
+        return list(dict.fromkeys(
+            f'CWE-{match.group(1)}'
+            for text in (result.get('test_name', ''), result.get('issue_text', ''))
+            if 'CWE' in text.upper()
+            for match in _CWE_RE.finditer(text)
+        ))
     
     def _get_references(self, result: Dict[str, Any]) -> List[str]:
         """Get reference URLs for the finding."""
@@ -116,7 +114,7 @@ class BanditScanner(BaseScanner):
         
         return references
     
-    def _parse_text_output(self, output: str) -> List[Dict[str, Any]]:
+    def _parse_text_output(self, output: str) -> List[Finding]:
         """Parse text output as fallback."""
         findings = []
         lines = output.split('\n')
@@ -129,7 +127,7 @@ class BanditScanner(BaseScanner):
             
             if line.startswith('>> Issue: '):
                 if current_finding and in_issue:
-                    findings.append(current_finding)
+                    findings.append(Finding.from_dict(current_finding))
                 
                 current_finding = {
                     'scanner': 'bandit',
@@ -159,6 +157,6 @@ class BanditScanner(BaseScanner):
                             current_finding['line'] = 0
         
         if current_finding and in_issue:
-            findings.append(current_finding)
+            findings.append(Finding.from_dict(current_finding))
         
-        return findings
\ No newline at end of file
+        return self.filter_by_severity(findings)
\ No newline at end of file
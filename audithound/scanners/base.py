@@ -1,27 +1,195 @@
 """Base scanner interface for all security scanners."""
 
+import asyncio
+import atexit
+import fnmatch
 import logging
+import os
 import shutil
+import signal
 import subprocess
+import threading
 from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Iterator, List, Dict, Any, Optional, Tuple, Union
 
 from ..core.config import ScannerConfig
-from ..utils.docker import DockerRunner
+from ..core.types import Finding
+from ..utils import jsonio
+
+if TYPE_CHECKING:
+    from ..utils.docker import DockerRunner
+
+
+# On-disk record of probe results so repeated CLI runs skip the fork/exec
+_PROBE_CACHE: Optional[Dict[str, Any]] = None
+_PROBE_CACHE_DIRTY = False
+# probe_all() runs probes on worker threads, so loading and updating the cache is serialized;
+# reentrant so a caller holding it can still use the helpers below
+_PROBE_CACHE_LOCK = threading.RLock()
+
+
+def _probe_cache_path() -> Path:
+    """Location of the persisted tool probe results."""
+    cache_root = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return cache_root / 'audithound' / 'tool-versions.json'
+
+
+def _load_probe_cache() -> Dict[str, Any]:
+    """Return the persisted probe results, reading them on first use."""
+    global _PROBE_CACHE
+    with _PROBE_CACHE_LOCK:
+        if _PROBE_CACHE is None:
+            try:
+                cached = jsonio.load_file(_probe_cache_path())
+            except (OSError, ValueError):
+                cached = None
+            _PROBE_CACHE = cached if isinstance(cached, dict) else {}
+        return _PROBE_CACHE
+
+
+def _save_probe_cache() -> None:
+    """Best-effort write of new probe results, registered with atexit."""
+    if not _PROBE_CACHE_DIRTY or _PROBE_CACHE is None:
+        return
+    path = _probe_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with _PROBE_CACHE_LOCK:
+            payload = jsonio.dumps(_PROBE_CACHE)
+        tmp.write_text(payload, encoding='utf-8')
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _remember_probe_change() -> None:
+    """Schedule the probe results to be persisted when the process exits."""
+    global _PROBE_CACHE_DIRTY
+    with _PROBE_CACHE_LOCK:
+        if not _PROBE_CACHE_DIRTY:
+            _PROBE_CACHE_DIRTY = True
+            atexit.register(_save_probe_cache)
+
+
+def _remember_probe(key: str, value: Any) -> None:
+    """Record a probe result to be persisted when the process exits."""
+    cache = _load_probe_cache()
+    with _PROBE_CACHE_LOCK:
+        cache[key] = value
+    _remember_probe_change()
+
+
+def _binary_mtime_ns(binary_path: Optional[str]) -> Optional[int]:
+    """Modification time of a resolved binary, or None if it can't be stat'ed."""
+    if binary_path is None:
+        return None
+    try:
+        return os.stat(binary_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _which_on_path(name: str, search_path: Optional[str]) -> Optional[str]:
+    """shutil.which() result for name, memoized per PATH value."""
+    return shutil.which(name, path=search_path)
+
+
+def _which(name: str) -> Optional[str]:
+    """Resolve name on the current PATH without re-walking it for repeat lookups."""
+    return _which_on_path(name, os.environ.get('PATH'))
+
+
+# Memoized in-process only: the answer depends on the current project's uv
+# environment, which can change between runs without the uv binary changing
+@lru_cache(maxsize=None)
+def _uv_help_returncode(binary_name: str, uv_path: str, uv_mtime_ns: Optional[int]) -> int:
+    """Exit code of ``uv run <binary> --help`` for the uv found at uv_path."""
+    return subprocess.run(
+        ['uv', 'run', binary_name, '--help'],
+        capture_output=True,
+        timeout=10
+    ).returncode
+
+
+# Version probes are keyed on the resolved binary path and its mtime, so
+# installing or upgrading a tool produces a fresh probe
+@lru_cache(maxsize=None)
+def _version_output(cmd: Tuple[str, ...], binary_path: Optional[str],
+                    binary_mtime_ns: Optional[int]) -> str:
+    """Output of a scanner's version command for the binary at binary_path."""
+    # Without a resolved binary (e.g. via uv) there is nothing stable to key on
+    key = None
+    if binary_mtime_ns is not None:
+        key = f"version:{' '.join(cmd)}:{binary_path}:{binary_mtime_ns}"
+        cached = _load_probe_cache().get(key)
+        if isinstance(cached, str):
+            return cached
+    result = subprocess.run(
+        list(cmd),
+        capture_output=True,
+        text=True,
+        timeout=10
+    )
+    version = result.stdout.strip() or result.stderr.strip()
+    if key is not None:
+        _remember_probe(key, version)
+    return version
+
+
+_POSIX = os.name == 'posix'
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """Kill a scanner started in its own session along with everything it spawned."""
+    try:
+        if _POSIX:
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+async def probe_all(scanners: List["BaseScanner"]) -> List[Tuple[bool, str]]:
+    """Probe several scanners at once; wall time is that of the slowest probe."""
+    return await asyncio.gather(*(scanner.probe_async() for scanner in scanners))
+
+
+class _SeverityRank(dict):
+    """Severity ranks that fall back to a case-insensitive lookup, then medium."""
+    
+    def __missing__(self, severity: str) -> int:
+        return self.get(severity.lower(), 2)
+
+
+# Ordering used to compare finding severities against a scanner's threshold.
+# Built-in scanners already emit lowercase severities, so lookups hit directly
+_SEVERITY_RANK = _SeverityRank({
+    'critical': 4,
+    'high': 3,
+    'medium': 2,
+    'low': 1,
+    'info': 0
+})
 
 
 class BaseScanner(ABC):
     """Abstract base class for all security scanners."""
     
-    def __init__(self, config: ScannerConfig, docker_runner: Optional[DockerRunner] = None):
+    def __init__(self, config: ScannerConfig, docker_runner: Optional["DockerRunner"] = None):
         self.config = config
         self.docker_runner = docker_runner
         self.name = self.__class__.__name__.replace('Scanner', '').lower()
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._severity_threshold_level = _SEVERITY_RANK[config.severity_threshold]
+        self._exclude_re = config.exclude_matcher
     
     @abstractmethod
-    def scan(self, target: Path) -> List[Dict[str, Any]]:
+    def scan(self, target: Path) -> List[Finding]:
         """
         Run the scanner on the target path.
         
@@ -29,7 +197,7 @@ class BaseScanner(ABC):
             target: Path to scan
             
         Returns:
-            List of findings as dictionaries
+            List of findings
         """
         pass
     
@@ -47,7 +215,7 @@ class BaseScanner(ABC):
         pass
     
     @abstractmethod
-    def parse_output(self, output: str) -> List[Dict[str, Any]]:
+    def parse_output(self, output: str) -> List[Finding]:
         """
         Parse scanner output into standardized findings format.
         
@@ -55,7 +223,7 @@ class BaseScanner(ABC):
             output: Raw scanner output
             
         Returns:
-            List of findings as dictionaries
+            List of findings
         """
         pass
     
@@ -70,24 +238,21 @@ class BaseScanner(ABC):
         
         # Check if scanner binary is in PATH directly
         binary_name = self.get_binary_name()
-        if shutil.which(binary_name) is not None:
+        if _which(binary_name) is not None:
             self.logger.debug(f"{self.name} binary found in PATH: {binary_name}")
             return True
             
         # Check if uv is available and can run the scanner
-        if shutil.which('uv') is not None:
+        uv_path = _which('uv')
+        if uv_path is not None:
             try:
                 self.logger.debug(f"Trying to run {self.name} via uv")
-                result = subprocess.run(
-                    ['uv', 'run', binary_name, '--help'],
-                    capture_output=True,
-                    timeout=10
-                )
-                available = result.returncode == 0
+                returncode = _uv_help_returncode(binary_name, uv_path, _binary_mtime_ns(uv_path))
+                available = returncode == 0
                 if available:
                     self.logger.debug(f"{self.name} available via uv")
                 else:
-                    self.logger.debug(f"{self.name} not available via uv (exit code: {result.returncode})")
+                    self.logger.debug(f"{self.name} not available via uv (exit code: {returncode})")
                 return available
             except (subprocess.TimeoutExpired, FileNotFoundError) as e:
                 self.logger.debug(f"{self.name} check via uv failed: {e}")
@@ -95,80 +260,176 @@ class BaseScanner(ABC):
         self.logger.warning(f"{self.name} scanner not available")
         return False
     
+    async def probe_async(self) -> Tuple[bool, str]:
+        """Return (available, version) without blocking the event loop."""
+        # The probes block on subprocesses, so they run in worker threads
+        if not await asyncio.to_thread(self.is_available):
+            return False, "unknown"
+        return True, await asyncio.to_thread(self.get_version)
+    
+    @staticmethod
+    def clear_probe_cache() -> None:
+        """Forget cached availability and version probes, including the on-disk record."""
+        _which_on_path.cache_clear()
+        _uv_help_returncode.cache_clear()
+        _version_output.cache_clear()
+        with _PROBE_CACHE_LOCK:
+            _load_probe_cache().clear()
+            _remember_probe_change()
+    
     def get_binary_name(self) -> str:
         """Get the name of the scanner binary."""
         return self.name
     
-    def _get_command_prefix(self) -> List[str]:
-        """Get command prefix (empty list or 'uv run')."""
-        # If scanner is directly available, no prefix needed
-        if shutil.which(self.get_binary_name()) is not None:
-            return []
-        
-        # If uv is available, use it
-        if shutil.which('uv') is not None:
+    @cached_property
+    def _command_prefix(self) -> List[str]:
+        """Command prefix (empty list or 'uv run'), resolved once per scanner."""
+        # If scanner is directly available, no prefix needed; otherwise use uv if present
+        if _which(self.get_binary_name()) is None and _which('uv') is not None:
             return ['uv', 'run']
-        
         return []
     
     def get_version(self) -> str:
         """Get scanner version."""
         try:
-            cmd = self._get_command_prefix() + [self.get_binary_name(), '--version']
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            return result.stdout.strip() or result.stderr.strip()
+            binary_name = self.get_binary_name()
+            cmd = self._command_prefix + [binary_name, '--version']
+            binary_path = _which(binary_name)
+            return _version_output(tuple(cmd), binary_path, _binary_mtime_ns(binary_path))
         except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
             return "unknown"
     
-    def run_command(self, cmd: List[str], target: Path) -> str:
+    def run_command(self, cmd: List[str], target: Path, text: bool = True) -> Union[str, bytes]:
         """
         Execute the scanner command.
         
         Args:
             cmd: Command to execute
             target: Target path being scanned
+            text: Decode native output to str; pass False to get the raw stdout bytes
             
         Returns:
-            Command output as string
+            Command output as string (or bytes for native runs with text=False)
             
         Raises:
-            subprocess.CalledProcessError: If command fails
+            subprocess.CalledProcessError: If the command times out, cannot be run,
+                or exits non-zero without writing any output
         """
         if self.docker_runner:
             return self.docker_runner.run_command(cmd, target, self.get_docker_image())
         else:
-            return self._run_native_command(cmd, target)
+            return self._run_native_command(cmd, target, text)
     
-    def _run_native_command(self, cmd: List[str], target: Path) -> str:
+    def _run_native_command(self, cmd: List[str], target: Path, text: bool = True) -> Union[str, bytes]:
         """Run command natively (without Docker)."""
         # Add command prefix (uv run if needed)
-        final_cmd = self._get_command_prefix() + cmd
+        final_cmd = self._command_prefix + cmd
+        
+        timeout = self.docker_runner.timeout if self.docker_runner else 300
         
         try:
-            result = subprocess.run(
+            # Run in a new session so a timeout can take down helpers the tool
+            # spawned (e.g. via uv run) that would otherwise keep the pipes open
+            with subprocess.Popen(
                 final_cmd,
                 cwd=target,
-                capture_output=True,
-                text=True,
-                timeout=self.docker_runner.timeout if self.docker_runner else 300,
-                check=False  # Don't raise exception on non-zero exit
-            )
-            
-            # Many security scanners return non-zero exit codes when findings are found
-            # So we don't check return code here, just return the output
-            return result.stdout
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=text,
+                start_new_session=_POSIX
+            ) as proc:
+                try:
+                    stdout, stderr = proc.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    _kill_process_group(proc)
+                    proc.communicate()
+                    raise
             
-        except subprocess.TimeoutExpired:
+        except subprocess.TimeoutExpired as e:
+            raise subprocess.CalledProcessError(
+                -1, final_cmd, f"Scanner timed out after {timeout}s"
+            ) from e
+        except Exception as e:
+            raise subprocess.CalledProcessError(-1, final_cmd, str(e)) from e
+        
+        # Many security scanners return non-zero exit codes when findings are found,
+        # so the status only counts as a failure when the tool wrote nothing at all
+        if proc.returncode != 0 and not stdout:
             raise subprocess.CalledProcessError(
-                -1, final_cmd, f"Scanner timed out after {300}s"
+                proc.returncode, final_cmd,
+                f"Scanner exited with status {proc.returncode} and produced no output",
+                stderr
+            )
+        return stdout
+    
+    def run_command_stream(self, cmd: List[str], target: Path) -> Iterator[Union[str, bytes]]:
+        """
+        Execute the scanner command and yield its output line by line.
+        
+        Native runs yield raw stdout lines as they are produced, so the output
+        is never held whole; Docker runs yield the lines of the collected output.
+        
+        Raises:
+            subprocess.CalledProcessError: If the command times out or cannot be run,
+                or exits non-zero without writing any output
+        """
+        if self.docker_runner:
+            yield from self.docker_runner.run_command(cmd, target, self.get_docker_image()).splitlines()
+        else:
+            yield from self._stream_native_command(cmd, target)
+    
+    def _stream_native_command(self, cmd: List[str], target: Path) -> Iterator[bytes]:
+        """Run command natively and yield stdout lines as they arrive."""
+        final_cmd = self._command_prefix + cmd
+        timeout = 300
+        
+        try:
+            # stderr is discarded rather than piped so an unread pipe cannot stall the tool
+            proc = subprocess.Popen(
+                final_cmd,
+                cwd=target,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=_POSIX
             )
         except Exception as e:
-            raise subprocess.CalledProcessError(-1, final_cmd, str(e))
+            raise subprocess.CalledProcessError(-1, final_cmd, str(e)) from e
+        
+        # Reading the pipe blocks, so the timeout is enforced from a watchdog thread
+        timed_out = threading.Event()
+        
+        def expire() -> None:
+            timed_out.set()
+            _kill_process_group(proc)
+        
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+        drained = False
+        produced = False
+        with proc:
+            try:
+                for line in proc.stdout:
+                    produced = True
+                    yield line
+                drained = True
+            finally:
+                watchdog.cancel()
+                if not drained and proc.poll() is None:
+                    # The consumer stopped early; don't leave the scanner running
+                    _kill_process_group(proc)
+        
+        if timed_out.is_set():
+            raise subprocess.CalledProcessError(
+                -1, final_cmd, f"Scanner timed out after {timeout}s"
+            )
+        if proc.returncode != 0 and not produced:
+            # Non-zero with findings is normal; non-zero with no output at all
+            # means the tool failed and must not be reported as a clean scan
+            raise subprocess.CalledProcessError(
+                proc.returncode, final_cmd,
+                f"Scanner exited with status {proc.returncode} and produced no output"
+            )
     
     def get_docker_image(self) -> str:
         """Get Docker image name for this scanner."""
@@ -177,37 +438,25 @@ class BaseScanner(ABC):
     
     def should_exclude_path(self, path: Path, base_path: Path) -> bool:
         """Check if a path should be excluded from scanning."""
-        relative_path = str(path.relative_to(base_path))
-        
-        for pattern in self.config.exclude_patterns:
-            if self._matches_pattern(relative_path, pattern):
-                return True
+        # Every pattern is folded into one regex, so each path is matched in a single pass
+        matcher = self._exclude_re
+        if matcher is None:
+            return False
         
-        return False
+        return matcher.match(str(path.relative_to(base_path))) is not None
     
     def _matches_pattern(self, path: str, pattern: str) -> bool:
         """Check if path matches exclusion pattern."""
-        import fnmatch
         return fnmatch.fnmatch(path, pattern)
     
-    def filter_by_severity(self, findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def meets_severity_threshold(self, severity: str) -> bool:
+        """Check whether a severity is at or above the configured threshold."""
+        return _SEVERITY_RANK[severity] >= self._severity_threshold_level
+    
+    def filter_by_severity(self, findings: List[Finding]) -> List[Finding]:
         """Filter findings by severity threshold."""
-        severity_levels = {
-            'critical': 4,
-            'high': 3,
-            'medium': 2,
-            'low': 1,
-            'info': 0
-        }
-        
-        threshold = severity_levels.get(self.config.severity_threshold.lower(), 2)
-        
-        filtered = []
-        for finding in findings:
-            finding_severity = finding.get('severity', 'medium').lower()
-            finding_level = severity_levels.get(finding_severity, 2)
-            
-            if finding_level >= threshold:
-                filtered.append(finding)
-        
-        return filtered
\ No newline at end of file
+        threshold = self._severity_threshold_level
+        return [
+            finding for finding in findings
+            if _SEVERITY_RANK[finding.get('severity', 'medium')] >= threshold
+        ]
\ No newline at end of file
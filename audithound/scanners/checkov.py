@@ -1,10 +1,24 @@
 """Checkov infrastructure as code scanner implementation."""
 
-import json
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from .base import BaseScanner
+from ..core.types import Finding
+from ..utils import jsonio
+
+
+_CWE_RE = re.compile(r'CWE[-\s]?(\d+)', re.IGNORECASE)
+
+# Checkov severity to standard severity levels
+_SEVERITY_MAP = {
+    'CRITICAL': 'critical',
+    'HIGH': 'high',
+    'MEDIUM': 'medium',
+    'LOW': 'low',
+    'INFO': 'info'
+}
 
 
 class CheckovScanner(BaseScanner):
@@ -16,23 +30,14 @@ class CheckovScanner(BaseScanner):
     def get_docker_image(self) -> str:
         return "bridgecrew/checkov:latest"
     
-    def scan(self, target: Path) -> List[Dict[str, Any]]:
+    def scan(self, target: Path) -> List[Finding]:
         """Run Checkov scanner for IaC security issues."""
         cmd = self.get_command(target)
         
-        try:
-            output = self.run_command(cmd, target)
-            findings = self.parse_output(output)
-            return self.filter_by_severity(findings)
-        except Exception as e:
-            # Checkov returns non-zero exit code when issues are found
-            if hasattr(e, 'output') and e.output:
-                try:
-                    findings = self.parse_output(e.output)
-                    return self.filter_by_severity(findings)
-                except:
-                    pass
-            raise
+        # Non-zero exits still return the report, so the output is parsed once
+        # Raw bytes go straight to the JSON parser without a full-size decode
+        output = self.run_command(cmd, target, text=False)
+        return self.parse_output(output)
     
     def get_command(self, target: Path) -> List[str]:
         """Get Checkov command."""
@@ -48,64 +53,70 @@ class CheckovScanner(BaseScanner):
         
         return cmd
     
-    def parse_output(self, output: str) -> List[Dict[str, Any]]:
+    def parse_output(self, output: Union[str, bytes]) -> List[Finding]:
         """Parse Checkov JSON output."""
         findings = []
         
         try:
-            data = json.loads(output)
+            data = jsonio.loads(output)
             
-            # Parse failed checks - data is a list of check type results
+            # Collect failed (and, if requested, skipped) checks in one pass;
+            # data is a list of check type results
+            include_skipped = (
+                '--include-skipped' in (self.config.args or ())
+                and self.meets_severity_threshold('info')
+            )
             failed_checks = []
+            skipped_checks = []
             if isinstance(data, list):
                 for check_type_result in data:
                     if isinstance(check_type_result, dict):
                         results = check_type_result.get('results', {})
                         failed_checks.extend(results.get('failed_checks', []))
+                        if include_skipped:
+                            skipped_checks.extend(results.get('skipped_checks', []))
             
             for result in failed_checks:
-                finding = {
-                    'scanner': 'checkov',
-                    'rule_id': result.get('check_id', 'unknown'),
-                    'rule_name': result.get('check_name', 'unknown'),
-                    'severity': self._map_severity(result.get('severity', 'MEDIUM')),
-                    'message': self._format_message(result),
-                    'file': result.get('file_path', ''),
-                    'line': self._extract_line_range(result),
-                    'resource': result.get('resource', ''),
-                    'check_class': result.get('check_class', ''),
-                    'framework': result.get('check_type', ''),
-                    'description': result.get('description', ''),
-                    'guideline': result.get('guideline', ''),
-                    'cwe': self._extract_cwe(result),
-                    'references': self._get_references(result)
-                }
-                findings.append(finding)
+                # Drop findings below the threshold before building them
+                severity = self._map_severity(result.get('severity', 'MEDIUM'))
+                if not self.meets_severity_threshold(severity):
+                    continue
+                findings.append(Finding(
+                    scanner='checkov',
+                    rule_id=result.get('check_id', 'unknown'),
+                    rule_name=result.get('check_name', 'unknown'),
+                    severity=severity,
+                    message=self._format_message(result),
+                    file=result.get('file_path', ''),
+                    line=self._extract_line_range(result),
+                    extra={
+                        'resource': result.get('resource', ''),
+                        'check_class': result.get('check_class', ''),
+                        'framework': result.get('check_type', ''),
+                        'description': result.get('description', ''),
+                        'guideline': result.get('guideline', ''),
+                        'cwe': self._extract_cwe(result),
+                        'references': self._get_references(result)
+                    }
+                ))
             
             # Parse skipped checks if needed
-            if self.config.args and '--include-skipped' in self.config.args:
-                skipped_checks = []
-                if isinstance(data, list):
-                    for check_type_result in data:
-                        if isinstance(check_type_result, dict):
-                            results = check_type_result.get('results', {})
-                            skipped_checks.extend(results.get('skipped_checks', []))
-                
-                for result in skipped_checks:
-                    finding = {
-                        'scanner': 'checkov',
-                        'rule_id': result.get('check_id', 'unknown'),
-                        'rule_name': result.get('check_name', 'unknown'),
-                        'severity': 'info',
-                        'message': f"Skipped check: {result.get('suppress_comment', 'No reason provided')}",
-                        'file': result.get('file_path', ''),
-                        'line': self._extract_line_range(result),
+            for result in skipped_checks:
+                findings.append(Finding(
+                    scanner='checkov',
+                    rule_id=result.get('check_id', 'unknown'),
+                    rule_name=result.get('check_name', 'unknown'),
+                    severity='info',
+                    message=f"Skipped check: {result.get('suppress_comment', 'No reason provided')}",
+                    file=result.get('file_path', ''),
+                    line=self._extract_line_range(result),
+                    extra={
                         'resource': result.get('resource', ''),
                         'status': 'skipped'
                     }
-                    findings.append(finding)
-                
-        except json.JSONDecodeError as e:
+                ))
+            
+        except jsonio.JSONDecodeError as e:
             raise ValueError(f"Failed to parse Checkov output: {e}")
         
         return findings
@@ -115,14 +126,11 @@ class CheckovScanner(BaseScanner):
         if checkov_severity is None:
             return 'medium'
         
-        severity_map = {
-            'CRITICAL': 'critical',
-            'HIGH': 'high',
-            'MEDIUM': 'medium',
-            'LOW': 'low',
-            'INFO': 'info'
-        }
-        return severity_map.get(checkov_severity.upper(), 'medium')
+        # Reports use upper-case levels, so the exact lookup almost always hits
+        severity = _SEVERITY_MAP.get(checkov_severity)
+        if severity is None:
+            severity = _SEVERITY_MAP.get(checkov_severity.upper(), 'medium')
+        return severity
     
     def _format_message(self, result: Dict[str, Any]) -> str:
         """Format a readable message for the finding."""
@@ -142,7 +150,7 @@ class CheckovScanner(BaseScanner):
     
     def _extract_line_range(self, result: Dict[str, Any]) -> int:
         """Extract line number from result."""
-        file_line_range = result.get('file_line_range', [])
+        file_line_range = result.get('file_line_range')
         if file_line_range and len(file_line_range) >= 2:
             return file_line_range[0]  # Return start line
         return 0
@@ -156,15 +164,13 @@ class CheckovScanner(BaseScanner):
         guideline = result.get('guideline') or ''
         check_name = result.get('check_name') or ''
         
-        import re
-        cwe_pattern = r'CWE[-\s]?(\d+)'
-        
         for text in [description, guideline, check_name]:
             if text:  # Only process non-empty strings
-                matches = re.findall(cwe_pattern, text, re.IGNORECASE)
+                matches = _CWE_RE.findall(text)
                 cwe_list.extend([f'CWE-{match}' for match in matches])
         
-        return list(set(cwe_list))
+        # Deduplicated, in order of first appearance
+        return list(dict.fromkeys(cwe_list))
     
     def _get_references(self, result: Dict[str, Any]) -> List[str]:
         """Get reference URLs for the finding."""
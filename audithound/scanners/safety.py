@@ -1,10 +1,33 @@
 """Safety dependency vulnerability scanner implementation."""
 
-import json
+import os
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from .base import BaseScanner
+from ..core.types import Finding
+from ..utils import jsonio
+
+
+# Dependency manifests, in order of preference
+_REQUIREMENTS_FILES = (
+    'requirements.txt',
+    'requirements-dev.txt',
+    'pyproject.toml',
+    'Pipfile',
+    'poetry.lock'
+)
+_REQUIREMENTS_FILE_SET = frozenset(_REQUIREMENTS_FILES)
+
+_CVE_RE = re.compile(r'CVE[-\s]?(\d{4}[-\s]?\d+)', re.IGNORECASE)
+
+# Text report line like:
+# "vulnerability found in django installed: 2.0 affected: <2.0.8 safe: >=2.0.8"
+_VULNERABILITY_LINE_RE = re.compile(
+    r'vulnerability found in (\w+) installed: ([\d\.]+) affected: ([<>=\d\.\s,]+) safe: ([<>=\d\.\s,]+)',
+    re.IGNORECASE
+)
 
 
 class SafetyScanner(BaseScanner):
@@ -16,45 +39,38 @@ class SafetyScanner(BaseScanner):
     def get_docker_image(self) -> str:
         return "pyupio/safety:latest"
     
-    def scan(self, target: Path) -> List[Dict[str, Any]]:
+    def scan(self, target: Path) -> List[Finding]:
         """Run Safety scanner on Python dependencies."""
         cmd = self.get_command(target)
         
-        try:
-            output = self.run_command(cmd, target)
-            findings = self.parse_output(output)
-            return self.filter_by_severity(findings)
-        except Exception as e:
-            # Safety returns non-zero exit code when vulnerabilities are found
-            if hasattr(e, 'output') and e.output:
-                try:
-                    findings = self.parse_output(e.output)
-                    return self.filter_by_severity(findings)
-                except:
-                    pass
-            raise
+        # Non-zero exits still return the report, so the output is parsed once
+        # Raw bytes go straight to the JSON parser without a full-size decode
+        output = self.run_command(cmd, target, text=False)
+        return self.parse_output(output)
     
     def get_command(self, target: Path) -> List[str]:
         """Get Safety command."""
         cmd = ['safety', 'check']
         
-        # Look for requirements files
-        req_files = [
-            target / 'requirements.txt',
-            target / 'requirements-dev.txt',
-            target / 'pyproject.toml',
-            target / 'Pipfile',
-            target / 'poetry.lock'
-        ]
+        # Look for requirements files with one directory listing instead of a stat per candidate
+        try:
+            with os.scandir(target) as entries:
+                # Match names first so is_file() never runs for unrelated entries
+                present = {
+                    entry.name for entry in entries
+                    if entry.name in _REQUIREMENTS_FILE_SET and entry.is_file()
+                }
+        except OSError:
+            present = set()
         
         # Use first found requirements file
-        for req_file in req_files:
-            if req_file.exists():
-                if req_file.name == 'pyproject.toml':
+        for req_name in _REQUIREMENTS_FILES:
+            if req_name in present:
+                if req_name == 'pyproject.toml':
                     # For pyproject.toml, we need to scan the environment
                     break
                 else:
-                    cmd.extend(['-r', str(req_file)])
+                    cmd.extend(['-r', str(target / req_name)])
                     break
         
         # Add configured arguments
@@ -62,32 +78,48 @@ class SafetyScanner(BaseScanner):
         
         return cmd
     
-    def parse_output(self, output: str) -> List[Dict[str, Any]]:
+    def parse_output(self, output: Union[str, bytes]) -> List[Finding]:
         """Parse Safety output."""
+        # Safety's text report never looks like JSON, so skip the doomed parse attempt
+        head = output[:64]
+        if isinstance(head, bytes):
+            head = head.decode('latin-1')
+        if not head.lstrip().startswith(('[', '{')):
+            if isinstance(output, bytes):
+                output = output.decode('utf-8', errors='replace')
+            return self._parse_text_output(output)
+        
         findings = []
         
         try:
             # Try parsing as JSON first
-            data = json.loads(output)
+            data = jsonio.loads(output)
             
             for vuln in data:
-                finding = {
-                    'scanner': 'safety',
-                    'rule_id': vuln.get('id', 'unknown'),
-                    'rule_name': f"Vulnerable dependency: {vuln.get('package', 'unknown')}",
-                    'severity': self._map_severity(vuln.get('vulnerability_id', '')),
-                    'message': vuln.get('advisory', ''),
-                    'package': vuln.get('package', ''),
-                    'installed_version': vuln.get('installed_version', ''),
-                    'affected_version': vuln.get('affected_version', ''),
-                    'safe_version': vuln.get('safe_version', ''),
-                    'cve': self._extract_cve(vuln),
-                    'references': self._get_references(vuln)
-                }
-                findings.append(finding)
+                # Drop findings below the threshold before building them
+                severity = self._map_severity(vuln.get('vulnerability_id', ''))
+                if not self.meets_severity_threshold(severity):
+                    continue
+                findings.append(Finding(
+                    scanner='safety',
+                    rule_id=vuln.get('id', 'unknown'),
+                    rule_name=f"Vulnerable dependency: {vuln.get('package', 'unknown')}",
+                    severity=severity,
+                    message=vuln.get('advisory', ''),
+                    extra={
+                        'package': vuln.get('package', ''),
+                        'installed_version': vuln.get('installed_version', ''),
+                        'affected_version': vuln.get('affected_version', ''),
+                        'safe_version': vuln.get('safe_version', ''),
+                        'cve': self._extract_cve(vuln),
+                        'references': self._get_references(vuln)
+                    }
+                ))
                 
-        except json.JSONDecodeError:
+        except jsonio.JSONDecodeError:
             # Parse text output
+            if isinstance(output, bytes):
+                output = output.decode('utf-8', errors='replace')
             findings = self._parse_text_output(output)
         
         return findings
@@ -107,14 +139,12 @@ class SafetyScanner(BaseScanner):
         advisory = vuln.get('advisory', '')
         vuln_id = vuln.get('vulnerability_id', '')
         
-        import re
-        cve_pattern = r'CVE[-\s]?(\d{4}[-\s]?\d+)'
-        
         for text in [advisory, vuln_id]:
-            matches = re.findall(cve_pattern, text, re.IGNORECASE)
+            matches = _CVE_RE.findall(text)
             cve_list.extend([f'CVE-{match.replace(" ", "-")}' for match in matches])
         
-        return list(set(cve_list))
+        # Deduplicated, in order of first appearance
+        return list(dict.fromkeys(cve_list))
     
     def _get_references(self, vuln: Dict[str, Any]) -> List[str]:
         """Get reference URLs for the vulnerability."""
@@ -130,26 +160,32 @@ class SafetyScanner(BaseScanner):
         
         return references
     
-    def _parse_text_output(self, output: str) -> List[Dict[str, Any]]:
+    def _parse_text_output(self, output: str) -> List[Finding]:
         """Parse text output as fallback."""
         findings = []
         lines = output.split('\n')
         
         current_finding = {}
+        # Message lines are joined once per finding rather than re-concatenated per line
+        message_parts = []
         
         for line in lines:
             line = line.strip()
+            lowered = line.lower()
             
             # Look for vulnerability entries
-            if line.startswith('vulnerability found in ') or 'installed:' in line.lower():
+            if line.startswith('vulnerability found in ') or 'installed:' in lowered:
                 if current_finding:
-                    findings.append(current_finding)
+                    current_finding['message'] = ' '.join(message_parts)
+                    findings.append(Finding.from_dict(current_finding))
+                current_finding = {}
+                message_parts = []
                 
-                # Parse package info from line like:
-                # "vulnerability found in django installed: 2.0 affected: <2.0.8 safe: >=2.0.8"
-                import re
-                pattern = r'vulnerability found in (\w+) installed: ([\d\.]+) affected: ([<>=\d\.\s,]+) safe: ([<>=\d\.\s,]+)'
-                match = re.search(pattern, line, re.IGNORECASE)
+                # Parse package info from the line; the regex can only match
+                # lines that carry its literal prefix, so check for that first
+                match = None
+                if 'vulnerability found in ' in lowered:
+                    match = _VULNERABILITY_LINE_RE.search(line)
                 
                 if match:
                     current_finding = {
@@ -159,15 +195,16 @@ class SafetyScanner(BaseScanner):
                         'package': match.group(1),
                         'installed_version': match.group(2),
                         'affected_version': match.group(3),
-                        'safe_version': match.group(4),
-                        'message': line
+                        'safe_version': match.group(4)
                     }
+                    message_parts = [line]
             
             elif current_finding and line and not line.startswith('-'):
                 # Additional description lines
-                current_finding['message'] = current_finding.get('message', '') + ' ' + line
+                message_parts.append(line)
         
         if current_finding:
-            findings.append(current_finding)
+            current_finding['message'] = ' '.join(message_parts)
+            findings.append(Finding.from_dict(current_finding))
         
-        return findings
\ No newline at end of file
+        return self.filter_by_severity(findings)
\ No newline at end of file
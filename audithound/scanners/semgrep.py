@@ -1,10 +1,25 @@
 """Semgrep static analysis scanner implementation."""
 
-import json
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from .base import BaseScanner
+from ..core.types import Finding
+from ..utils import jsonio
+
+
+_CWE_RE = re.compile(r'CWE[-\s]?(\d+)', re.IGNORECASE)
+
+# Shared stand-in for absent sections of a result; only ever read
+_EMPTY: Dict[str, Any] = {}
+
+# Semgrep severity to standard severity levels
+_SEVERITY_MAP = {
+    'ERROR': 'high',
+    'WARNING': 'medium',
+    'INFO': 'low'
+}
 
 
 class SemgrepScanner(BaseScanner):
@@ -16,23 +31,14 @@ class SemgrepScanner(BaseScanner):
     def get_docker_image(self) -> str:
         return "returntocorp/semgrep:latest"
     
-    def scan(self, target: Path) -> List[Dict[str, Any]]:
+    def scan(self, target: Path) -> List[Finding]:
         """Run Semgrep scanner."""
         cmd = self.get_command(target)
         
-        try:
-            output = self.run_command(cmd, target)
-            findings = self.parse_output(output)
-            return self.filter_by_severity(findings)
-        except Exception as e:
-            # Semgrep may return non-zero exit code when findings are found
-            if hasattr(e, 'output') and e.output:
-                try:
-                    findings = self.parse_output(e.output)
-                    return self.filter_by_severity(findings)
-                except:
-                    pass
-            raise
+        # Non-zero exits still return the report, so the output is parsed once
+        # Raw bytes go straight to the JSON parser without a full-size decode
+        output = self.run_command(cmd, target, text=False)
+        return self.parse_output(output)
     
     def get_command(self, target: Path) -> List[str]:
         """Get Semgrep command."""
@@ -51,33 +57,42 @@ class SemgrepScanner(BaseScanner):
         
         return cmd
     
-    def parse_output(self, output: str) -> List[Dict[str, Any]]:
+    def parse_output(self, output: Union[str, bytes]) -> List[Finding]:
         """Parse Semgrep JSON output."""
         findings = []
         
         try:
-            data = json.loads(output)
+            data = jsonio.loads(output)
             
             for result in data.get('results', []):
-                finding = {
-                    'scanner': 'semgrep',
-                    'rule_id': result.get('check_id', 'unknown'),
-                    'rule_name': self._get_rule_name(result),
-                    'severity': self._map_severity(result.get('extra', {}).get('severity', 'INFO')),
-                    'message': result.get('extra', {}).get('message', result.get('check_id', '')),
-                    'file': result.get('path', ''),
-                    'line': result.get('start', {}).get('line', 0),
-                    'column': result.get('start', {}).get('col', 0),
-                    'end_line': result.get('end', {}).get('line', 0),
-                    'end_column': result.get('end', {}).get('col', 0),
-                    'code': result.get('extra', {}).get('lines', ''),
-                    'cwe': self._extract_cwe(result),
-                    'owasp': self._extract_owasp(result),
-                    'references': self._get_references(result)
-                }
-                findings.append(finding)
+                # Bind the nested sections once instead of re-fetching them per field
+                details = result.get('extra') or _EMPTY
+                # Drop findings below the threshold before building them
+                severity = self._map_severity(details.get('severity', 'INFO'))
+                if not self.meets_severity_threshold(severity):
+                    continue
+                start = result.get('start') or _EMPTY
+                end = result.get('end') or _EMPTY
+                findings.append(Finding(
+                    scanner='semgrep',
+                    rule_id=result.get('check_id', 'unknown'),
+                    rule_name=self._get_rule_name(result),
+                    severity=severity,
+                    message=details.get('message', result.get('check_id', '')),
+                    file=result.get('path', ''),
+                    line=start.get('line', 0),
+                    extra={
+                        'column': start.get('col', 0),
+                        'end_line': end.get('line', 0),
+                        'end_column': end.get('col', 0),
+                        'code': details.get('lines', ''),
+                        'cwe': self._extract_cwe(result),
+                        'owasp': self._extract_owasp(result),
+                        'references': self._get_references(result)
+                    }
+                ))
                 
-        except json.JSONDecodeError as e:
+        except jsonio.JSONDecodeError as e:
             raise ValueError(f"Failed to parse Semgrep output: {e}")
         
         return findings
@@ -96,12 +111,11 @@ class SemgrepScanner(BaseScanner):
     
     def _map_severity(self, semgrep_severity: str) -> str:
         """Map Semgrep severity to standard severity levels."""
-        severity_map = {
-            'ERROR': 'high',
-            'WARNING': 'medium',
-            'INFO': 'low'
-        }
-        return severity_map.get(semgrep_severity.upper(), 'medium')
+        # Reports use upper-case levels, so the exact lookup almost always hits
+        severity = _SEVERITY_MAP.get(semgrep_severity)
+        if severity is None:
+            severity = _SEVERITY_MAP.get(semgrep_severity.upper(), 'medium')
+        return severity
     
     def _extract_cwe(self, result: Dict[str, Any]) -> List[str]:
         """Extract CWE identifiers from result."""
@@ -122,14 +136,12 @@ class SemgrepScanner(BaseScanner):
         check_id = result.get('check_id', '')
         message = extra.get('message', '')
         
-        import re
-        cwe_pattern = r'CWE[-\s]?(\d+)'
-        
         for text in [check_id, message]:
-            matches = re.findall(cwe_pattern, text, re.IGNORECASE)
+            matches = _CWE_RE.findall(text)
             cwe_list.extend([f'CWE-{match}' for match in matches])
         
-        return list(set(cwe_list))
+        # Deduplicated, in order of first appearance
+        return list(dict.fromkeys(cwe_list))
     
     def _extract_owasp(self, result: Dict[str, Any]) -> List[str]:
         """Extract OWASP categories from result."""
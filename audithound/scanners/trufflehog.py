@@ -1,10 +1,36 @@
 """TruffleHog secrets scanner implementation."""
 
-import json
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Optional, Union
 
 from .base import BaseScanner
+from ..core.types import Finding
+from ..utils import jsonio
+
+# Indexed by the Verified flag: verified secrets are high severity, unverified are medium
+_SEVERITY_BY_VERIFIED = ('medium', 'high')
+
+_TRUFFLEHOG_DOC_URL = 'https://trufflesecurity.com/trufflehog'
+
+# Detector-specific documentation, built once rather than per finding
+_DETECTOR_REFS = {
+    'AWS': 'https://docs.aws.amazon.com/IAM/latest/UserGuide/id_credentials_access-keys.html',
+    'GitHub': 'https://docs.github.com/en/authentication/keeping-your-account-and-data-secure/managing-your-personal-access-tokens',
+    'GitLab': 'https://docs.gitlab.com/ee/user/profile/personal_access_tokens.html',
+    'Slack': 'https://api.slack.com/authentication/token-types',
+    'JWT': 'https://jwt.io/introduction',
+    'Docker': 'https://docs.docker.com/engine/reference/commandline/login/#credentials-store',
+    'NPM': 'https://docs.npmjs.com/about-access-tokens'
+}
+
+
+def _filesystem_info(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the SourceMetadata.Data.Filesystem section of a result, if present."""
+    source_metadata = result.get('SourceMetadata', {})
+    if 'Data' in source_metadata and 'Filesystem' in source_metadata['Data']:
+        return source_metadata['Data']['Filesystem']
+    return None
 
 
 class TrufflehogScanner(BaseScanner):
@@ -16,23 +42,13 @@ class TrufflehogScanner(BaseScanner):
     def get_docker_image(self) -> str:
         return "trufflesecurity/trufflehog:latest"
     
-    def scan(self, target: Path) -> List[Dict[str, Any]]:
+    def scan(self, target: Path) -> List[Finding]:
         """Run TruffleHog scanner for secrets detection."""
         cmd = self.get_command(target)
         
-        try:
-            output = self.run_command(cmd, target)
-            findings = self.parse_output(output)
-            return self.filter_by_severity(findings)
-        except Exception as e:
-            # TruffleHog may return non-zero exit code when secrets are found
-            if hasattr(e, 'output') and e.output:
-                try:
-                    findings = self.parse_output(e.output)
-                    return self.filter_by_severity(findings)
-                except:
-                    pass
-            raise
+        # Findings are parsed line by line as TruffleHog writes them, so the
+        # full report is never buffered
+        return self._parse_lines(self.run_command_stream(cmd, target))
     
     def get_command(self, target: Path) -> List[str]:
         """Get TruffleHog command."""
@@ -46,108 +62,86 @@ class TrufflehogScanner(BaseScanner):
         
         return cmd
     
-    def parse_output(self, output: str) -> List[Dict[str, Any]]:
+    def parse_output(self, output: Union[str, bytes]) -> List[Finding]:
         """Parse TruffleHog JSON output."""
-        findings = []
-        
         # TruffleHog outputs one JSON object per line
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            try:
-                result = json.loads(line)
-                
-                finding = {
-                    'scanner': 'trufflehog',
-                    'rule_id': result.get('DetectorName', 'unknown'),
-                    'rule_name': f"Secret detected: {result.get('DetectorName', 'unknown')}",
-                    'severity': self._map_severity(result.get('Verified', False)),
-                    'message': self._format_message(result),
-                    'file': self._extract_file_path(result),
-                    'line': self._extract_line_number(result),
-                    'secret_type': result.get('DetectorName', ''),
-                    'verified': result.get('Verified', False),
-                    'raw_secret': result.get('Raw', ''),
-                    'redacted_secret': self._redact_secret(result.get('Raw', '')),
-                    'source_metadata': result.get('SourceMetadata', {}),
-                    'references': self._get_references(result)
-                }
+        return self._parse_lines(output.splitlines())
+    
+    def _parse_lines(self, lines: Iterable[Union[str, bytes]]) -> List[Finding]:
+        """Parse an iterable of NDJSON lines, consuming it as it goes."""
+        findings = []
+        for line in lines:
+            finding = self.parse_line(line)
+            if finding is not None:
                 findings.append(finding)
-                
-            except json.JSONDecodeError:
-                # Skip invalid JSON lines
-                continue
-        
         return findings
     
-    def _map_severity(self, verified: bool) -> str:
-        """Map verification status to severity level."""
-        # Verified secrets are high severity, unverified are medium
-        return 'high' if verified else 'medium'
-    
-    def _format_message(self, result: Dict[str, Any]) -> str:
-        """Format a readable message for the finding."""
-        detector = result.get('DetectorName', 'unknown')
-        verified = result.get('Verified', False)
+    def parse_line(self, line: Union[str, bytes]) -> Optional[Finding]:
+        """Parse one line of TruffleHog JSON output into a finding."""
+        if not line.strip():
+            return None
         
-        status = "verified" if verified else "potential"
-        
-        source_metadata = result.get('SourceMetadata', {})
-        if 'Data' in source_metadata and 'Filesystem' in source_metadata['Data']:
-            file_info = source_metadata['Data']['Filesystem']
-            file_path = file_info.get('file', 'unknown file')
-            return f"Detected {status} {detector} secret in {file_path}"
-        
-        return f"Detected {status} {detector} secret"
-    
-    def _extract_file_path(self, result: Dict[str, Any]) -> str:
-        """Extract file path from result."""
-        source_metadata = result.get('SourceMetadata', {})
-        
-        if 'Data' in source_metadata and 'Filesystem' in source_metadata['Data']:
-            return source_metadata['Data']['Filesystem'].get('file', '')
+        try:
+            result = jsonio.loads(line)
+        except jsonio.JSONDecodeError:
+            # Skip invalid JSON lines
+            return None
         
-        return ''
-    
-    def _extract_line_number(self, result: Dict[str, Any]) -> int:
-        """Extract line number from result."""
-        source_metadata = result.get('SourceMetadata', {})
+        # Drop findings below the threshold before building them
+        verified = result.get('Verified', False)
+        severity = _SEVERITY_BY_VERIFIED[bool(verified)]
+        if not self.meets_severity_threshold(severity):
+            return None
         
-        if 'Data' in source_metadata and 'Filesystem' in source_metadata['Data']:
-            return source_metadata['Data']['Filesystem'].get('line', 0)
+        # Walk down to the filesystem metadata once for the file, line and message
+        filesystem = _filesystem_info(result)
+        if filesystem is not None:
+            file_path = filesystem.get('file', '')
+            line_number = filesystem.get('line', 0)
+            location = f" in {filesystem.get('file', 'unknown file')}"
+        else:
+            file_path, line_number, location = '', 0, ''
         
-        return 0
+        # Detector names repeat across thousands of findings; intern them so every
+        # finding that names the same detector shares one string
+        detector = result.get('DetectorName', 'unknown')
+        if isinstance(detector, str):
+            detector = sys.intern(detector)
+        status = "verified" if verified else "potential"
+        raw_secret = result.get('Raw', '')
+        return Finding(
+            scanner='trufflehog',
+            rule_id=detector,
+            rule_name=sys.intern(f"Secret detected: {detector}"),
+            severity=severity,
+            message=f"Detected {status} {detector} secret{location}",
+            file=file_path,
+            line=line_number,
+            extra={
+                'secret_type': detector if 'DetectorName' in result else '',
+                'verified': verified,
+                'raw_secret': raw_secret,
+                'redacted_secret': self._redact_secret(raw_secret),
+                'source_metadata': result.get('SourceMetadata', {}),
+                'references': self._get_references(result)
+            }
+        )
     
     def _redact_secret(self, raw_secret: str) -> str:
         """Redact the secret for safe display."""
-        if len(raw_secret) <= 8:
-            return '*' * len(raw_secret)
-        else:
-            # Show first 4 and last 4 characters
-            return raw_secret[:4] + '*' * (len(raw_secret) - 8) + raw_secret[-4:]
+        length = len(raw_secret)
+        if length <= 8:
+            return '*' * length
+        # Show first 4 and last 4 characters; the f-string builds the result in one
+        # allocation instead of two intermediate concatenations
+        return f"{raw_secret[:4]}{'*' * (length - 8)}{raw_secret[-4:]}"
     
     def _get_references(self, result: Dict[str, Any]) -> List[str]:
         """Get reference URLs for the finding."""
-        references = []
-        
         detector = result.get('DetectorName', '')
-        if detector:
-            # Add TruffleHog documentation
-            references.append('https://trufflesecurity.com/trufflehog')
-            
-            # Add detector-specific references if available
-            detector_refs = {
-                'AWS': 'https://docs.aws.amazon.com/IAM/latest/UserGuide/id_credentials_access-keys.html',
-                'GitHub': 'https://docs.github.com/en/authentication/keeping-your-account-and-data-secure/managing-your-personal-access-tokens',
-                'GitLab': 'https://docs.gitlab.com/ee/user/profile/personal_access_tokens.html',
-                'Slack': 'https://api.slack.com/authentication/token-types',
-                'JWT': 'https://jwt.io/introduction',
-                'Docker': 'https://docs.docker.com/engine/reference/commandline/login/#credentials-store',
-                'NPM': 'https://docs.npmjs.com/about-access-tokens'
-            }
-            
-            if detector in detector_refs:
-                references.append(detector_refs[detector])
+        if not detector:
+            return []
         
-        return references
\ No newline at end of file
+        # Add detector-specific references if available
+        detector_ref = _DETECTOR_REFS.get(detector)
+        return [_TRUFFLEHOG_DOC_URL, detector_ref] if detector_ref else [_TRUFFLEHOG_DOC_URL]
@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from ...utils import jsonio
 from ..state.store import AppStore
 from ..state.events import EventType
 
@@ -210,8 +211,8 @@ class PersistenceService:
     def load_scan_history(self) -> bool:
         """Load scan history from disk."""
         try:
-            with open(self.history_file, 'r') as f:
-                history_data = json.load(f)
+            # History grows with every scan, so parse it from a memory map
+            history_data = jsonio.load_file(self.history_file)
             
             # Convert timestamps back to datetime objects
             scan_history = []
@@ -313,9 +313,13 @@ class ScanService:
         """Fallback export implementation."""
         if format_type.lower() == "json":
             import json
+            from ...core.types import AggregatedResults
+            from ...utils.output import OutputFormatter
             
-            # Convert results to dict
-            if hasattr(results, '__dict__'):
+            # Convert results to dict; aggregated results use the CLI's JSON layout
+            if isinstance(results, AggregatedResults):
+                data = OutputFormatter(self.config.output)._json_data(results)
+            elif hasattr(results, '__dict__'):
                 data = results.__dict__
             else:
                 data = {"results": str(results)}
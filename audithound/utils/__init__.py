@@ -1,6 +1,16 @@
 """Utility functions for AuditHound."""
 
-from .docker import DockerRunner
-from .output import OutputFormatter
+from typing import Any
 
-__all__ = ["DockerRunner", "OutputFormatter"]
\ No newline at end of file
+__all__ = ["DockerRunner", "OutputFormatter"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access so importing a utility module does not load the Docker SDK or rich
+    if name == "DockerRunner":
+        from .docker import DockerRunner
+        return DockerRunner
+    if name == "OutputFormatter":
+        from .output import OutputFormatter
+        return OutputFormatter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -42,11 +42,11 @@ class DockerRunner:
             environment: Environment variables
             
         Returns:
-            Command output
+            Command output, also when the container exits non-zero
             
         Raises:
-            subprocess.CalledProcessError: If command fails
-            RuntimeError: If Docker is not available
+            subprocess.CalledProcessError: If the container exits non-zero without any output
+            RuntimeError: If Docker is not available or the container cannot run
         """
         if not self.is_available():
             raise RuntimeError("Docker is not available")
@@ -104,11 +104,19 @@ class DockerRunner:
                 return str(container)
                 
         except docker.errors.ContainerError as e:
-            # Container ran but exited with non-zero code
-            output = e.container.logs().decode('utf-8', errors='replace')
-            self.logger.error(f"Docker container exited with code {e.exit_status}")
-            self.logger.debug(f"Container output: {output}")
-            raise subprocess.CalledProcessError(e.exit_status, cmd, output)
+            # Container ran but exited with non-zero code; scanners do this when
+            # they report findings, so hand back the output like a native run.
+            # With no output at all the tool failed and must not look like a clean scan
+            output = e.container.logs(stdout=True, stderr=False).decode('utf-8', errors='replace')
+            self.logger.debug(f"Docker container exited with code {e.exit_status}")
+            if not output:
+                self.logger.error(f"Docker container exited with code {e.exit_status} and no output")
+                raise subprocess.CalledProcessError(
+                    e.exit_status, cmd,
+                    f"Scanner exited with status {e.exit_status} and produced no output",
+                    e.stderr
+                ) from e
+            return output
         
         except docker.errors.ImageNotFound:
             self.logger.error(f"Docker image not found: {image}")
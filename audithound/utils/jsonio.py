@@ -0,0 +1,63 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+import mmap
+import os
+from typing import Any, BinaryIO, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only catch the latter
+JSONDecodeError = json.JSONDecodeError
+
+# Datetimes go through ``default`` so both backends render them the same way
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None else 0
+)
+
+
+def _stdlib_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from text or raw bytes with the stdlib parser."""
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        # orjson reports undecodable bytes as a JSON error; keep the fallback consistent
+        raise JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", 0) from e
+
+
+# Bound once at import so per-line NDJSON parsing calls the backend with no wrapper frame
+loads: Callable[[Union[str, bytes]], Any] = orjson.loads if orjson is not None else _stdlib_loads
+
+
+def load_file(path: Union[str, os.PathLike]) -> Any:
+    """Parse a JSON file through a read-only memory map instead of reading it into a buffer."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file; let the parser report it
+            return loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, indent=2, default=default)
+
+
+def dump(obj: Any, fp: BinaryIO, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """Serialize to a binary file object without building an intermediate str."""
+    if orjson is not None:
+        fp.write(orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS))
+        return
+    # The stdlib encoder yields small chunks, so the document is never held whole
+    for chunk in json.JSONEncoder(indent=2, default=default).iterencode(obj):
+        fp.write(chunk.encode("utf-8"))
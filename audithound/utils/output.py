@@ -1,12 +1,11 @@
 """Output formatting utilities for AuditHound."""
 
-import json
 import csv
 import logging
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import BinaryIO, Dict, Any, List
 from io import StringIO
 
 from rich.console import Console
@@ -17,6 +16,7 @@ from rich.text import Text
 
 from ..core.config import OutputConfig
 from ..core.types import AggregatedResults
+from . import jsonio
 
 
 class OutputFormatter:
@@ -62,8 +62,20 @@ class OutputFormatter:
         
         return console.file.getvalue()
     
+    def write(self, results: AggregatedResults, fp: BinaryIO) -> None:
+        """Write formatted results to a binary file object."""
+        if self.config.format.lower() in ('csv', 'xml', 'html', 'sarif'):
+            fp.write(self.format(results).encode('utf-8'))
+        else:
+            # JSON (also the default) is encoded straight into the file
+            jsonio.dump(self._json_data(results), fp, default=str)
+    
     def _format_json(self, results: AggregatedResults) -> str:
         """Format results as JSON."""
+        return jsonio.dumps(self._json_data(results), default=str)
+    
+    def _json_data(self, results: AggregatedResults) -> Dict[str, Any]:
+        """Build the JSON-serialisable view of the results."""
         data = {
             'scan_info': {
                 'target': results.target,
@@ -79,7 +91,7 @@ class OutputFormatter:
                 'scanner': scanner_name,
                 'status': result.status,
                 'duration': result.duration,
-                'findings': result.findings if self.config.include_passed or result.status != 'success' or result.findings else []
+                'findings': [dict(finding) for finding in result.findings] if self.config.include_passed or result.status != 'success' or result.findings else []
             }
             
             if result.error_message:
@@ -90,7 +102,7 @@ class OutputFormatter:
             
             data['results'].append(scanner_data)
         
-        return json.dumps(data, indent=2, default=str)
+        return data
     
     def _format_csv(self, results: AggregatedResults) -> str:
         """Format results as CSV."""
@@ -328,7 +340,7 @@ class OutputFormatter:
             
             sarif_report['runs'].append(run)
         
-        return json.dumps(sarif_report, indent=2)
+        return jsonio.dumps(sarif_report)
     
     def _severity_to_sarif_level(self, severity: str) -> str:
         """Convert severity to SARIF level."""
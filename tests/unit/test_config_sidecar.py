@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Test the JSON sidecar cache for parsed configuration files."""
+
+import os
+
+import pytest
+
+from audithound.core import config as config_module
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Point the sidecar cache at a temporary directory."""
+    home = tmp_path / "xdg"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home))
+    return home
+
+
+def _sidecar_for(path):
+    return config_module._sidecar_path(str(path.resolve()))
+
+
+def test_sidecar_written_for_json_safe_config(tmp_path):
+    path = tmp_path / "audithound.yaml"
+    path.write_text("target_path: src\nscanners:\n  bandit:\n    enabled: false\n")
+    data = {'target_path': 'src', 'scanners': {'bandit': {'enabled': False}}}
+
+    config_module._write_sidecar(str(path.resolve()), os.stat(path), data)
+
+    assert config_module._read_sidecar(str(path.resolve()), os.stat(path)) == data
+
+
+def test_sidecar_skipped_when_json_would_change_keys(tmp_path):
+    path = tmp_path / "audithound.yaml"
+    path.write_text("scanners:\n  1: {}\n  true: {}\n")
+    data = {'scanners': {1: {}, True: {}}}
+
+    config_module._write_sidecar(str(path.resolve()), os.stat(path), data)
+
+    assert not _sidecar_for(path).exists()
+
+
+def test_sidecar_ignored_after_file_changes(tmp_path):
+    path = tmp_path / "audithound.yaml"
+    path.write_text("target_path: src\n")
+    config_module._write_sidecar(str(path.resolve()), os.stat(path), {'target_path': 'src'})
+
+    path.write_text("target_path: other\n")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert config_module._read_sidecar(str(path.resolve()), os.stat(path)) is None
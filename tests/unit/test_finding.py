@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Test the Finding record's dict-compatible behaviour."""
+
+import pytest
+
+from audithound.core.types import Finding
+
+
+def _as_dict():
+    return {
+        'scanner': 'bandit',
+        'rule_id': 'B101',
+        'rule_name': 'assert_used',
+        'severity': 'low',
+        'message': 'Use of assert detected.',
+        'file': 'app.py',
+        'line': 3,
+        'confidence': 'high',
+        'cwe': ['CWE-703'],
+    }
+
+
+def test_from_dict_round_trips_through_dict():
+    data = _as_dict()
+
+    finding = Finding.from_dict(data)
+
+    assert dict(finding) == data
+    assert finding.to_dict() == data
+    assert list(finding) == list(data)
+
+
+def test_from_dict_keeps_unknown_keys_in_extra():
+    finding = Finding.from_dict(_as_dict())
+
+    assert finding.extra == {'confidence': 'high', 'cwe': ['CWE-703']}
+    assert finding['cwe'] == ['CWE-703']
+
+
+def test_compares_equal_to_plain_dict():
+    data = _as_dict()
+
+    assert Finding.from_dict(data) == data
+    assert data == Finding.from_dict(data)
+    assert Finding.from_dict(data) != dict(data, line=4)
+
+
+def test_get_and_contains():
+    finding = Finding.from_dict(_as_dict())
+
+    assert finding.get('severity') == 'low'
+    assert finding.get('confidence') == 'high'
+    assert finding.get('missing', 'default') == 'default'
+    assert 'rule_id' in finding
+    assert 'confidence' in finding
+    assert 'missing' not in finding
+
+
+def test_none_fields_read_as_missing():
+    finding = Finding(scanner='safety', severity='medium')
+
+    assert 'file' not in finding
+    assert finding.get('file', '') == ''
+    with pytest.raises(KeyError):
+        finding['file']
+    assert dict(finding) == {'scanner': 'safety', 'severity': 'medium'}
+    assert len(finding) == 2
+
+
+def test_from_dict_with_missing_common_keys():
+    finding = Finding.from_dict({'scanner': 'checkov', 'resource': 'aws_s3_bucket.a'})
+
+    assert finding.rule_id is None
+    assert dict(finding) == {'scanner': 'checkov', 'resource': 'aws_s3_bucket.a'}
+
+
+def test_low_cardinality_strings_are_interned():
+    first = Finding.from_dict({'scanner': ''.join(['ban', 'dit']), 'severity': ''.join(['hi', 'gh']),
+                               'rule_id': ''.join(['B1', '01'])})
+    second = Finding.from_dict({'scanner': ''.join(['band', 'it']), 'severity': ''.join(['h', 'igh']),
+                                'rule_id': ''.join(['B', '101'])})
+
+    assert first.scanner is second.scanner
+    assert first.severity is second.severity
+    assert first.rule_id is second.rule_id
+
+
+def test_is_read_only_mapping():
+    finding = Finding.from_dict(_as_dict())
+
+    with pytest.raises(TypeError):
+        finding['severity'] = 'high'
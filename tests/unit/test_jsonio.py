@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Test the JSON helpers with both the orjson and stdlib backends."""
+
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from audithound.utils import jsonio
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def backend(request, monkeypatch):
+    """Run a test once per backend; orjson is skipped when it isn't installed."""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(jsonio, 'orjson', None)
+        monkeypatch.setattr(jsonio, 'loads', jsonio._stdlib_loads)
+    return request.param
+
+
+DOCUMENT = {'results': [{'line': 3, 'cwe': ['CWE-703'], 'message': 'naïve'}], 'ok': True}
+
+
+def test_loads_accepts_text_and_bytes(backend):
+    text = json.dumps(DOCUMENT)
+
+    assert jsonio.loads(text) == DOCUMENT
+    assert jsonio.loads(text.encode('utf-8')) == DOCUMENT
+
+
+def test_loads_raises_json_decode_error(backend):
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads(b'not json')
+
+
+def test_loads_reports_invalid_utf8_as_json_error(backend):
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads(b'{"a": "\xff"}')
+
+
+def test_load_file(backend, tmp_path):
+    path = tmp_path / 'doc.json'
+    path.write_text(json.dumps(DOCUMENT), encoding='utf-8')
+
+    assert jsonio.load_file(path) == DOCUMENT
+
+
+def test_load_file_empty_raises(backend, tmp_path):
+    path = tmp_path / 'empty.json'
+    path.write_bytes(b'')
+
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.load_file(path)
+
+
+def test_dumps_and_dump_agree(backend):
+    when = datetime(2024, 1, 2, 3, 4, 5)
+    obj = {'when': when, 'items': [1, 2]}
+
+    text = jsonio.dumps(obj, default=str)
+    buffer = io.BytesIO()
+    jsonio.dump(obj, buffer, default=str)
+
+    assert json.loads(text) == {'when': str(when), 'items': [1, 2]}
+    assert buffer.getvalue().decode('utf-8') == text
+
+
+def test_dumps_indents_by_two_spaces(backend):
+    assert jsonio.dumps({'a': 1}) == '{\n  "a": 1\n}'
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Test the on-disk scanner result cache."""
+
+import os
+import stat
+import time
+
+import pytest
+
+from audithound.core import result_cache
+from audithound.core.types import Finding
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Point the cache at a temporary XDG cache directory."""
+    home = tmp_path / "xdg"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home))
+    return home
+
+
+def _finding():
+    return Finding(scanner="bandit", rule_id="B101", severity="low", file="a.py", line=3,
+                   extra={"cwe": ["CWE-703"]})
+
+
+def test_cache_key_changes_with_each_input(tmp_path):
+    base = ("bandit", "1.7.5", "setup", tmp_path, "digest")
+    key = result_cache.cache_key(*base)
+    assert key == result_cache.cache_key(*base)
+    for index, value in enumerate(("semgrep", "1.7.6", "other", tmp_path / "x", "changed")):
+        changed = list(base)
+        changed[index] = value
+        assert result_cache.cache_key(*changed) != key
+
+
+def test_tree_fingerprint_tracks_every_file(tmp_path):
+    target = tmp_path / "repo"
+    (target / "node_modules" / "dep").mkdir(parents=True)
+    (target / "app.py").write_text("x = 1\n")
+    vendored = target / "node_modules" / "dep" / "index.js"
+    vendored.write_text("a\n")
+
+    digest = result_cache.tree_fingerprint(target)
+    assert digest == result_cache.tree_fingerprint(target)
+
+    # Scanners read vendored code too, so editing it must invalidate the cache
+    vendored.write_text("changed\n")
+    assert result_cache.tree_fingerprint(target) != digest
+
+
+def test_store_then_load_round_trips(tmp_path):
+    result_cache.store("bandit", "k1", [_finding()], ttl=60)
+
+    loaded = result_cache.load("bandit", "k1", ttl=60)
+
+    assert loaded is not None
+    assert [dict(finding) for finding in loaded] == [dict(_finding())]
+
+
+def test_store_is_owner_only(cache_home):
+    result_cache.store("bandit", "k1", [_finding()], ttl=60)
+
+    directory = cache_home / "audithound" / "results" / "bandit"
+    assert stat.S_IMODE((directory / "k1.json").stat().st_mode) == 0o600
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+
+def test_load_misses_unknown_key():
+    assert result_cache.load("bandit", "missing", ttl=60) is None
+
+
+def test_expired_entries_are_ignored_and_pruned(cache_home):
+    result_cache.store("bandit", "old", [_finding()], ttl=60)
+    path = cache_home / "audithound" / "results" / "bandit" / "old.json"
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+
+    assert result_cache.load("bandit", "old", ttl=60) is None
+    assert not path.exists()
+
+
+def test_store_prunes_other_expired_entries(cache_home):
+    result_cache.store("bandit", "old", [_finding()], ttl=60)
+    old = cache_home / "audithound" / "results" / "bandit" / "old.json"
+    stale = time.time() - 120
+    os.utime(old, (stale, stale))
+
+    result_cache.store("bandit", "new", [_finding()], ttl=60)
+
+    assert not old.exists()
+    assert result_cache.load("bandit", "new", ttl=60) is not None
+
+
+def test_trufflehog_results_are_never_cached(cache_home):
+    secret = Finding(scanner="trufflehog", rule_id="AWS", extra={"raw_secret": "AKIA..."})
+
+    result_cache.store("trufflehog", "k1", [secret], ttl=60)
+
+    assert not result_cache.is_cacheable("trufflehog")
+    assert not (cache_home / "audithound" / "results" / "trufflehog").exists()
+    assert result_cache.load("trufflehog", "k1", ttl=60) is None
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Test the backwards-reading log tail used by `audithound logs`."""
+
+import pytest
+
+from audithound import main
+from audithound.main import _tail_log_lines
+
+
+def _reference_tail(lines, count, level=None):
+    """What the old readlines()-based implementation returned."""
+    if level:
+        lines = [line for line in lines if level.upper() in line]
+    return lines[-count:] if len(lines) > count else lines
+
+
+LINES = [
+    f"2024-01-01 00:00:{i:02d} - audithound - {('INFO', 'WARNING', 'ERROR', 'DEBUG')[i % 4]} - message {i}"
+    for i in range(60)
+]
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "audithound.log"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 8192])
+@pytest.mark.parametrize("count", [1, 5, 50, 100])
+@pytest.mark.parametrize("level", [None, "error", "warning"])
+def test_matches_reading_the_whole_file(log_file, monkeypatch, chunk_size, count, level):
+    # Small chunks force lines to straddle chunk boundaries
+    monkeypatch.setattr(main, "_LOG_CHUNK_SIZE", chunk_size)
+
+    assert _tail_log_lines(log_file, count, level) == _reference_tail(LINES, count, level)
+
+
+def test_file_without_trailing_newline(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "_LOG_CHUNK_SIZE", 5)
+    path = tmp_path / "audithound.log"
+    path.write_text("first\nsecond\nthird", encoding="utf-8")
+
+    assert _tail_log_lines(path, 2) == ["second", "third"]
+    assert _tail_log_lines(path, 10) == ["first", "second", "third"]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "audithound.log"
+    path.write_bytes(b"")
+
+    assert _tail_log_lines(path, 10) == []
+
+
+def test_level_with_no_matches(log_file):
+    assert _tail_log_lines(log_file, 10, "critical") == []
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Test streaming TruffleHog output through parse_line."""
+
+import json
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from audithound.core.config import ScannerConfig
+from audithound.scanners import base
+from audithound.scanners.trufflehog import TrufflehogScanner
+
+
+def _record(detector, verified, raw, file_path, line):
+    return {
+        'DetectorName': detector,
+        'Verified': verified,
+        'Raw': raw,
+        'SourceMetadata': {'Data': {'Filesystem': {'file': file_path, 'line': line}}},
+    }
+
+
+RECORDS = [
+    _record('AWS', True, 'AKIAABCDEFGHIJKL', 'config.py', 4),
+    _record('Slack', False, 'xoxb-123', 'bot.py', 10),
+]
+NDJSON = ''.join(json.dumps(record) + '\n' for record in RECORDS) + 'not json\n\n'
+
+
+@pytest.fixture
+def scanner():
+    scanner = TrufflehogScanner(ScannerConfig())
+    # Run the command as given instead of going through uv
+    scanner._command_prefix = []
+    return scanner
+
+
+def _python(code):
+    return [sys.executable, '-c', code]
+
+
+def test_parse_line(scanner):
+    finding = scanner.parse_line(json.dumps(RECORDS[0]).encode('utf-8'))
+
+    assert finding['rule_id'] == 'AWS'
+    assert finding['severity'] == 'high'
+    assert finding['file'] == 'config.py'
+    assert finding['line'] == 4
+    assert finding['message'] == 'Detected verified AWS secret in config.py'
+    assert finding['redacted_secret'] == 'AKIA********IJKL'
+
+
+def test_parse_line_skips_blank_and_invalid_lines(scanner):
+    assert scanner.parse_line(b'') is None
+    assert scanner.parse_line(b'   \n') is None
+    assert scanner.parse_line(b'{broken') is None
+
+
+def test_parse_output_matches_streamed_scan(scanner, tmp_path, monkeypatch):
+    report = tmp_path / 'report.ndjson'
+    report.write_text(NDJSON, encoding='utf-8')
+    # Exit non-zero like `trufflehog --fail` does when it finds secrets
+    monkeypatch.setattr(scanner, 'get_command', lambda target: _python(
+        f"import sys; sys.stdout.write(open({str(report)!r}).read()); sys.exit(183)"
+    ))
+
+    streamed = scanner.scan(tmp_path)
+
+    assert [dict(finding) for finding in streamed] == [
+        dict(finding) for finding in scanner.parse_output(NDJSON.encode('utf-8'))
+    ]
+    assert [finding['rule_id'] for finding in streamed] == ['AWS', 'Slack']
+
+
+def test_stream_applies_severity_threshold(tmp_path, monkeypatch):
+    scanner = TrufflehogScanner(ScannerConfig(severity_threshold='high'))
+    scanner._command_prefix = []
+    monkeypatch.setattr(scanner, 'get_command', lambda target: _python(
+        f"print({json.dumps(json.dumps(RECORDS[1]))}); print({json.dumps(json.dumps(RECORDS[0]))})"
+    ))
+
+    assert [finding['rule_id'] for finding in scanner.scan(tmp_path)] == ['AWS']
+
+
+def test_stream_raises_on_failure_without_output(scanner, tmp_path):
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        list(scanner.run_command_stream(_python("import sys; sys.exit(2)"), tmp_path))
+
+    assert excinfo.value.returncode == 2
+
+
+def test_stream_raises_when_command_is_missing(scanner, tmp_path):
+    with pytest.raises(subprocess.CalledProcessError):
+        list(scanner.run_command_stream(['audithound-no-such-binary'], tmp_path))
+
+
+def test_stream_times_out(scanner, tmp_path, monkeypatch):
+    # Fire the watchdog almost immediately instead of after 300s
+    timer = threading.Timer
+    monkeypatch.setattr(base.threading, 'Timer',
+                        lambda interval, function: timer(0.2, function))
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        list(scanner.run_command_stream(_python("import time; time.sleep(30)"), tmp_path))
+
+    assert 'timed out' in excinfo.value.output
+
+
+def test_closing_the_stream_early_stops_the_process(scanner, tmp_path):
+    stream = scanner.run_command_stream(
+        _python("import time\nwhile True:\n    print('x', flush=True)\n    time.sleep(0.01)"),
+        tmp_path,
+    )
+
+    assert next(stream) == b'x\n'
+    stream.close()